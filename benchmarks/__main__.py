@@ -0,0 +1,72 @@
+"""Run the benchmark suite.
+
+```sh
+uv run python -m benchmarks --output results.json
+uv run python -m benchmarks --baseline results.json
+```
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+from pathlib import Path
+
+from benchmarks import cases  # noqa: F401 - registers cases
+from benchmarks.harness import REGISTRY, find_regressions, run_case
+
+
+def main() -> int:
+    """Run benchmarks. Return exit status: 1 if there are regressions, else 0."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("-k", "--filter", default="", help="run matching names only")
+    parser.add_argument("--repeat", type=int, default=5, help="rounds per case")
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    parser.add_argument("--baseline", type=Path, help="compare with JSON results")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.25,
+        help="flag results worse than baseline * threshold",
+    )
+    args = parser.parse_args()
+
+    results = []
+    for bench in REGISTRY:
+        if args.filter not in bench.name:
+            continue
+
+        for params in bench.cases():
+            result = run_case(bench, params, repeat=args.repeat)
+            print(
+                f"{result.key:<90} {result.seconds * 1e3:>10.3f} ms"
+                f" {result.peak_memory_bytes / 1024:>10.1f} KiB",
+                flush=True,
+            )
+            results.append(result.as_dict())
+
+    report = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())["results"]
+        regressions = find_regressions(results, baseline, threshold=args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,184 @@
+"""Contains benchmark cases for `flatlandian` hot paths.
+
+Cases are seeded, so each run does the same work.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING
+
+from pygame.math import Vector2
+
+from benchmarks.harness import benchmark
+from flatlandian import collision, geometry
+from flatlandian.chunked_grid import ChunkedGrid
+from flatlandian.entity import Entity
+from flatlandian.grid import Grid
+from flatlandian.int_vector2 import IntVector2
+from flatlandian.navigation_grid import NavigationGrid
+from flatlandian.steering import Steering
+from flatlandian.world import World
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+SEED = 0
+
+
+def obstructed_grid(size: int, density: float) -> NavigationGrid:
+    """Return square `NavigationGrid` with `density` of nodes randomly blocked.
+
+    Opposite corners are kept clear.
+    """
+    rng = random.Random(SEED)
+    grid = NavigationGrid(IntVector2(size, size))
+    corners = {IntVector2(0, 0), IntVector2(size - 1, size - 1)}
+    grid.blocked_nodes = {
+        node for node in grid.nodes if rng.random() < density and node not in corners
+    }
+    return grid
+
+
+@benchmark(size=[32, 128, 512])
+def grid_construction(size: int) -> Callable[[], object]:
+    """Construct a square `Grid`."""
+    return lambda: Grid(IntVector2(size, size))
+
+
+@benchmark(
+    size=[32, 128],
+    density=[0.0, 0.2],
+    algorithm=[
+        "UNIFORM_COST_SEARCH",
+        "BIDIRECTIONAL_UNIFORM_COST_SEARCH",
+        "BIDIRECTIONAL_A_STAR",
+    ],
+)
+def navigation_grid_route(
+    size: int, density: float, algorithm: str
+) -> Callable[[], object]:
+    """Route corner to corner of a square `NavigationGrid`."""
+    grid = obstructed_grid(size, density)
+    goal = IntVector2(size - 1, size - 1)
+    return lambda: grid.route(IntVector2(0, 0), goal, algorithm)
+
+
+@benchmark(radius=[8, 32])
+def cells_in_circle(radius: int) -> Callable[[], object]:
+    """Find cells in a circle."""
+    center = IntVector2(3, 4)
+    return lambda: geometry.cells_in_circle(center=center, radius=radius)
+
+
+@benchmark(n=[10_000])
+def int_vector2_arithmetic(n: int) -> Callable[[], object]:
+    """Add, subtract, and multiply `IntVector2`s."""
+    rng = random.Random(SEED)
+    vecs = [IntVector2(rng.randrange(100), rng.randrange(100)) for _ in range(n)]
+    offset = IntVector2(1, -1)
+
+    def func() -> object:
+        return [(v + offset - v) * 2 for v in vecs]
+
+    return func
+
+
+@benchmark(entities=[1_000, 10_000], radius=[1.0, 5.0])
+def world_update(entities: int, radius: float) -> Callable[[], object]:
+    """Update a `World` with collision detection, resolution and containment."""
+    rng = random.Random(SEED)
+    world = World(
+        size_from_sequence=(1000, 1000),
+        detect_collisions=True,
+        resolve_collisions=True,
+        contain_entities=True,
+    )
+    for position in world.random_positions(entities, rng=rng):
+        velocity = Vector2(rng.uniform(-1, 1), rng.uniform(-1, 1))
+        world.add_entity(Entity(position=position, velocity=velocity, radius=radius))
+
+    return lambda: world.update(1 / 60)
+
+
+@benchmark(entities=[20_000, 50_000], large_radius=[0.0, 500.0])
+def find_contacts(entities: int, large_radius: float) -> Callable[[], object]:
+    """Find contacts among entities of radius 1, plus one of `large_radius`."""
+    rng = random.Random(SEED)
+    world = World(size_from_sequence=(1000, 1000))
+    positions = world.random_positions(entities, rng=rng)
+    population = [
+        Entity(position=position, velocity=Vector2(), radius=1)
+        for position in positions
+    ]
+    population.append(
+        Entity(position=Vector2(500, 500), velocity=Vector2(), radius=large_radius)
+    )
+    return lambda: collision.find_contacts(population)
+
+
+@benchmark(radius=[8, 32], density=[0.0, 0.2])
+def navigation_grid_visible_cells(radius: int, density: float) -> Callable[[], object]:
+    """Shadowcast field of view, uncached."""
+    grid = obstructed_grid(2 * radius + 1, density)
+    origin = IntVector2(radius, radius)
+    grid.unblock(origin)
+
+    def func() -> object:
+        grid.clear_visibility_cache()
+        return grid.visible_cells(origin, radius)
+
+    return func
+
+
+@benchmark(entities=[1_000, 10_000])
+def steering_flock(entities: int) -> Callable[[], object]:
+    """Flock: separation, alignment and cohesion of boids, then apply."""
+    rng = random.Random(SEED)
+    world = World(size_from_sequence=(1000, 1000))
+    boids = [
+        Entity(
+            position=position,
+            velocity=Vector2(rng.uniform(-1, 1), rng.uniform(-1, 1)),
+            radius=1,
+        )
+        for position in world.random_positions(entities, rng=rng)
+    ]
+
+    def func() -> object:
+        flock = Steering(boids, max_speed=2, max_force=0.5)
+        flock.separation(5, weight=1.5)
+        flock.alignment(10)
+        flock.cohesion(10)
+        flock.apply()
+        return flock
+
+    return func
+
+
+@benchmark(distance=[128, 512], density=[0.0, 0.2])
+def chunked_grid_route(distance: int, density: float) -> Callable[[], object]:
+    """Route diagonally across a `ChunkedGrid`, through many chunks."""
+    grid = ChunkedGrid()
+    for node in obstructed_grid(distance, density).blocked_nodes:
+        grid.block(node)
+
+    goal = IntVector2(distance - 1, distance - 1)
+    return lambda: grid.route(IntVector2(0, 0), goal)
+
+
+@benchmark(size=[128, 1024], blocked=[False, True])
+def navigation_grid_construction(size: int, *, blocked: bool) -> Callable[[], object]:
+    """Construct a square `NavigationGrid`, and route between nearby nodes.
+
+    `blocked`: whether a node is blocked, beside the route.
+    """
+
+    def func() -> object:
+        grid = NavigationGrid(IntVector2(size, size))
+        if blocked:
+            grid.block(IntVector2(1, 0))
+
+        return grid.route(IntVector2(0, 0), IntVector2(2, 2))
+
+    return func
@@ -0,0 +1,118 @@
+"""Contains the benchmark registry, runner and baseline comparison."""
+
+from __future__ import annotations
+
+import itertools
+import statistics
+import timeit
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    Setup = Callable[..., Callable[[], object]]
+    """Takes benchmark params; returns the callable to time."""
+
+REGISTRY: list[Benchmark] = []
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """A benchmark: `setup` takes params, and returns the callable to time."""
+
+    name: str
+    setup: Setup
+    param_grid: dict[str, list[Any]]
+
+    def cases(self) -> Iterator[dict[str, Any]]:
+        """Yield each combination of params."""
+        keys = list(self.param_grid)
+        for values in itertools.product(*self.param_grid.values()):
+            yield dict(zip(keys, values, strict=True))
+
+
+@dataclass(frozen=True, kw_only=True)
+class Result:
+    """Timing and memory of one benchmark case."""
+
+    name: str
+    params: dict[str, Any]
+    seconds: float
+    """Median time per call."""
+    min_seconds: float
+    """Fastest time per call."""
+    peak_memory_bytes: int
+    """Peak memory allocated by a single call, from `tracemalloc`."""
+
+    @property
+    def key(self) -> str:
+        """Return unique identifier, for comparison with baseline."""
+        params = ",".join(f"{k}={v}" for k, v in self.params.items())
+        return f"{self.name}[{params}]"
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return JSON-serializable representation."""
+        return {"key": self.key, **asdict(self)}
+
+
+def benchmark(**param_grid: list[Any]) -> Callable[[Setup], Setup]:
+    """Register the decorated setup function as a benchmark over `param_grid`."""
+
+    def register(setup: Setup) -> Setup:
+        REGISTRY.append(Benchmark(setup.__name__, setup, param_grid))
+        return setup
+
+    return register
+
+
+def run_case(bench: Benchmark, params: dict[str, Any], *, repeat: int) -> Result:
+    """Time `bench` with `params`; return `Result`.
+
+    Each of `repeat` rounds runs enough calls to take at least 0.2 s.
+    """
+    func = bench.setup(**params)
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    per_call = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return Result(
+        name=bench.name,
+        params=params,
+        seconds=statistics.median(per_call),
+        min_seconds=min(per_call),
+        peak_memory_bytes=peak,
+    )
+
+
+def find_regressions(
+    results: list[dict[str, Any]],
+    baseline: list[dict[str, Any]],
+    *,
+    threshold: float,
+) -> list[str]:
+    """Return descriptions of results slower or larger than baseline * `threshold`.
+
+    Cases missing from `baseline` are ignored.
+    """
+    baseline_by_key = {result["key"]: result for result in baseline}
+    regressions: list[str] = []
+    for result in results:
+        base = baseline_by_key.get(result["key"])
+        if base is None:
+            continue
+
+        for metric in ("seconds", "peak_memory_bytes"):
+            if base[metric] and result[metric] > base[metric] * threshold:
+                ratio = result[metric] / base[metric]
+                regressions.append(f"{result['key']}: {metric} x{ratio:.2f}")
+
+    return regressions
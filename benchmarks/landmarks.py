@@ -0,0 +1,89 @@
+"""Compare A* search expansions with and without landmarks (ALT).
+
+```sh
+uv run python -m benchmarks.landmarks
+```
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import time
+
+from benchmarks.cases import SEED, obstructed_grid
+from flatlandian.int_vector2 import IntVector2
+from flatlandian.navigation_grid import NavigationGrid, SearchStats
+
+
+def serpentine_grid(size: int) -> NavigationGrid:
+    """Return square `NavigationGrid` of corridors joined at alternate ends."""
+    grid = NavigationGrid(IntVector2(size, size))
+    grid.blocked_nodes = {
+        IntVector2(x, y)
+        for y in range(4, size, 4)
+        for x in range(size)
+        if x != (size - 1 if (y // 4) % 2 else 0)
+    }
+    return grid
+
+
+def compare(grid: NavigationGrid, *, queries: int, landmarks: int) -> dict[str, float]:
+    """Return mean expansions and times of A* and ALT over random queries."""
+    rng = random.Random(SEED)
+    open_nodes = sorted(
+        (node for node in grid.nodes if node not in grid.blocked_nodes),
+        key=lambda node: (node.x, node.y),
+    )
+    pairs = [(rng.choice(open_nodes), rng.choice(open_nodes)) for _ in range(queries)]
+
+    def run() -> tuple[float, float]:
+        expansions, seconds = [], []
+        for from_node, to_node in pairs:
+            stats = SearchStats()
+            grid.route(from_node, to_node, "A_STAR", stats=stats)
+            expansions.append(stats.nodes_expanded)
+            seconds.append(stats.elapsed)
+
+        return statistics.fmean(expansions), statistics.fmean(seconds)
+
+    grid.landmarks = None
+    a_star_expansions, a_star_seconds = run()
+    start_time = time.perf_counter()
+    grid.preprocess_landmarks(landmarks)
+    preprocess_seconds = time.perf_counter() - start_time
+    alt_expansions, alt_seconds = run()
+    return {
+        "a_star_expansions": a_star_expansions,
+        "alt_expansions": alt_expansions,
+        "expansion_ratio": alt_expansions / a_star_expansions,
+        "a_star_seconds": a_star_seconds,
+        "alt_seconds": alt_seconds,
+        "preprocess_seconds": preprocess_seconds,
+    }
+
+
+def main() -> None:
+    """Print comparison for several maps, as JSON."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.landmarks")
+    parser.add_argument("--size", type=int, default=128)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--landmarks", type=int, default=8)
+    args = parser.parse_args()
+
+    maps = {
+        "open": obstructed_grid(args.size, 0),
+        "obstacles_0.3": obstructed_grid(args.size, 0.3),
+        "serpentine": serpentine_grid(args.size),
+    }
+    results = {
+        name: compare(grid, queries=args.queries, landmarks=args.landmarks)
+        for name, grid in maps.items()
+    }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
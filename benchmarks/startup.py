@@ -0,0 +1,77 @@
+"""Measure import and construction time of a headless routing worker.
+
+Each sample runs a fresh interpreter, so imports are uncached.
+
+```sh
+uv run python -m benchmarks.startup
+```
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+_WORKER = """
+import sys, time
+start = time.perf_counter()
+from flatlandian.int_vector2 import IntVector2
+from flatlandian.navigation_grid import NavigationGrid
+imported = time.perf_counter()
+grid = NavigationGrid(IntVector2({size}, {size}))
+if {blocked}:
+    grid.block(IntVector2(1, 0))
+constructed = time.perf_counter()
+grid.route(IntVector2(0, 0), IntVector2(2, 2))
+grid.has_line_of_sight(IntVector2(0, 0), IntVector2(2, 2))
+routed = time.perf_counter()
+seconds = (imported - start, constructed - imported, routed - constructed)
+print(*seconds, "pygame" in sys.modules)
+"""
+"""Prints seconds to import, construct, and first route and line of sight query;
+and whether Pygame loaded."""
+
+
+def sample(size: int, *, blocked: bool) -> tuple[float, float, float, bool]:
+    """Run a worker in a fresh interpreter; return its measurements.
+
+    `blocked`: whether the grid has a blocked node.
+    """
+    output = (
+        subprocess.run(  # noqa: S603 - runs this interpreter on fixed code
+            [sys.executable, "-c", _WORKER.format(size=size, blocked=blocked)],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        .stdout.splitlines()[-1]  # after any Pygame banner
+        .split()
+    )
+    return float(output[0]), float(output[1]), float(output[2]), output[3] == "True"
+
+
+def main() -> None:
+    """Print median timings over several fresh interpreters, as JSON."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.startup")
+    parser.add_argument("--size", type=int, default=1024)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    results = {}
+    for name, blocked in (("open", False), ("blocked", True)):
+        samples = [sample(args.size, blocked=blocked) for _ in range(args.repeat)]
+        results[name] = {
+            "import_seconds": statistics.median(s[0] for s in samples),
+            "construct_seconds": statistics.median(s[1] for s in samples),
+            "first_query_seconds": statistics.median(s[2] for s in samples),
+            "pygame_imported": any(s[3] for s in samples),
+        }
+
+    print(json.dumps({"size": args.size, **results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Measure `World.update` scaling with `threads`, on this interpreter.
+
+Run on both a standard and a free-threaded (no-GIL) build to compare:
+
+```sh
+uv run python -m benchmarks.threads
+uv run --python 3.13t python -m benchmarks.threads
+```
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import sys
+import timeit
+
+from pygame.math import Vector2
+
+from benchmarks.cases import SEED
+from flatlandian.entity import Entity
+from flatlandian.world import World
+
+
+def gil_enabled() -> bool:
+    """Return whether the GIL is enabled; always `True` before Python 3.13."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else bool(is_gil_enabled())
+
+
+def seconds_per_update(
+    *, entities: int, threads: int, sharding: str, repeat: int
+) -> float:
+    """Return best time per `World.update` of `entities`, on `threads`."""
+    rng = random.Random(SEED)
+    world = World(
+        size_from_sequence=(1000, 1000),
+        contain_entities=True,
+        threads=threads,
+        sharding=sharding,
+    )
+    for position in world.random_positions(entities, rng=rng):
+        velocity = Vector2(rng.uniform(-1, 1), rng.uniform(-1, 1))
+        world.add_entity(Entity(position=position, velocity=velocity))
+
+    timer = timeit.Timer(lambda: world.update(1 / 60))
+    number, _ = timer.autorange()
+    seconds = min(timer.repeat(repeat=repeat, number=number)) / number
+    world.close()
+    return seconds
+
+
+def main() -> None:
+    """Print time per update and speedup for 1 to N threads, as JSON."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.threads")
+    parser.add_argument("--entities", type=int, default=100_000)
+    parser.add_argument("--max-threads", type=int, default=8)
+    parser.add_argument("--sharding", default="ROUND_ROBIN")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    threads = 1
+    results = []
+    while threads <= args.max_threads:
+        seconds = seconds_per_update(
+            entities=args.entities,
+            threads=threads,
+            sharding=args.sharding,
+            repeat=args.repeat,
+        )
+        results.append({"threads": threads, "seconds": seconds})
+        threads *= 2
+
+    for result in results:
+        result["speedup"] = results[0]["seconds"] / result["seconds"]
+
+    print(
+        json.dumps(
+            {
+                "python": platform.python_version(),
+                "gil_enabled": gil_enabled(),
+                "entities": args.entities,
+                "sharding": args.sharding,
+                "results": results,
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
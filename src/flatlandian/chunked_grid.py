@@ -0,0 +1,257 @@
+"""Contains `ChunkedGrid` class: an unbounded, sparse navigable grid."""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import math
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from flatlandian.geometry import octile_length
+from flatlandian.grid import Grid
+from flatlandian.int_vector2 import IntVector2
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+_CHUNK_SUFFIX = ".chunk"
+
+
+@dataclass
+class ChunkedGrid:
+    """An unbounded navigable grid, stored as sparse fixed-size chunks.
+
+    Every node is traversable until blocked. A chunk of `chunk_size` squared
+    blocked flags is created on the first `block` within it, so memory grows
+    with the area written, not the area spanned.
+
+    If `max_loaded_chunks` is set, the least recently used chunks beyond it are
+    evicted, and loaded again from files in `store` on access. Only chunks
+    changed since they were loaded are written; `flush` writes the rest.
+    """
+
+    chunk_size: int = 64
+    max_loaded_chunks: int | None = None
+    """Chunks to keep in memory, at least 1; `None` for all. Requires `store`."""
+    store: Path | None = None
+    """Directory for evicted chunks. Chunks already in it are part of the grid."""
+    _chunks: OrderedDict[tuple[int, int], bytearray] = field(
+        init=False, default_factory=OrderedDict, repr=False
+    )
+    """Loaded chunks, least recently used first."""
+    _stored: set[tuple[int, int]] = field(init=False, default_factory=set, repr=False)
+    """Keys of chunks in `store`, loaded or not."""
+    _dirty: set[tuple[int, int]] = field(init=False, default_factory=set, repr=False)
+    """Keys of loaded chunks changed since they were loaded or written."""
+
+    def __post_init__(self) -> None:
+        if self.chunk_size < 1:
+            err_msg = f"Expected positive `chunk_size`, got {self.chunk_size}"
+            raise ValueError(err_msg)
+
+        if self.max_loaded_chunks is not None:
+            if self.max_loaded_chunks < 1:
+                err_msg = (
+                    "Expected positive `max_loaded_chunks`, "
+                    f"got {self.max_loaded_chunks}"
+                )
+                raise ValueError(err_msg)
+
+            if self.store is None:
+                err_msg = "`max_loaded_chunks` requires `store`"
+                raise ValueError(err_msg)
+
+        if self.store is not None:
+            self.store.mkdir(parents=True, exist_ok=True)
+            for path in self.store.glob(f"*{_CHUNK_SUFFIX}"):
+                x, y = path.stem.split("_")
+                self._stored.add((int(x), int(y)))
+
+    @property
+    def loaded_chunks(self) -> int:
+        """Number of chunks in memory."""
+        return len(self._chunks)
+
+    @property
+    def chunk_keys(self) -> set[tuple[int, int]]:
+        """Chunk coordinates of all chunks, loaded or stored."""
+        return set(self._chunks) | self._stored
+
+    def _chunk_path(self, key: tuple[int, int]) -> Path:
+        if self.store is None:
+            err_msg = "No `store` for chunks"
+            raise ValueError(err_msg)
+
+        return self.store / f"{key[0]}_{key[1]}{_CHUNK_SUFFIX}"
+
+    def _unload(self) -> None:
+        """Unload the least recently used chunk, writing it to `store` if dirty."""
+        key, chunk = self._chunks.popitem(last=False)
+        if key in self._dirty:
+            self._chunk_path(key).write_bytes(zlib.compress(chunk))
+            self._stored.add(key)
+            self._dirty.discard(key)
+
+    def _evict(self) -> None:
+        """Unload least recently used chunks, down to `max_loaded_chunks`."""
+        if self.max_loaded_chunks is None:
+            return
+
+        while len(self._chunks) > self.max_loaded_chunks:
+            self._unload()
+
+    def _chunk(self, key: tuple[int, int], *, create: bool) -> bytearray | None:
+        """Return chunk at chunk coordinates `key`, loading it if stored.
+
+        `create`: create it if it doesn't exist; otherwise return `None`.
+        """
+        chunk = self._chunks.get(key)
+        if chunk is not None:
+            self._chunks.move_to_end(key)
+            return chunk
+
+        if key in self._stored:
+            chunk = bytearray(zlib.decompress(self._chunk_path(key).read_bytes()))
+        elif create:
+            chunk = bytearray(self.chunk_size * self.chunk_size)
+        else:
+            return None
+
+        self._chunks[key] = chunk
+        self._evict()
+        return chunk
+
+    def _chunk_reader(self) -> Callable[[tuple[int, int]], bytearray | None]:
+        """Return a function to read chunks for one search, without creating them.
+
+        Without `max_loaded_chunks`, chunks read are cached for the search. With
+        it, each read goes through `_chunk`, so memory stays within the limit.
+        """
+        if self.max_loaded_chunks is not None:
+            return lambda key: self._chunk(key, create=False)
+
+        chunks: dict[tuple[int, int], bytearray | None] = {}
+
+        def read_chunk(key: tuple[int, int]) -> bytearray | None:
+            if key not in chunks:
+                chunks[key] = self._chunk(key, create=False)
+
+            return chunks[key]
+
+        return read_chunk
+
+    def flush(self) -> None:
+        """Write changed chunks to `store`, and unload all chunks."""
+        while self._chunks:
+            self._unload()
+
+    def is_traversable(self, node: IntVector2) -> bool:
+        """Return `True` if the node is traversable, else `False`."""
+        size = self.chunk_size
+        chunk = self._chunk((node.x // size, node.y // size), create=False)
+        return chunk is None or not chunk[(node.y % size) * size + node.x % size]
+
+    def block(self, node: IntVector2) -> None:
+        """Make `node` untraversable, creating its chunk if necessary."""
+        size = self.chunk_size
+        key = (node.x // size, node.y // size)
+        chunk = self._chunk(key, create=True)
+        if chunk is not None:
+            chunk[(node.y % size) * size + node.x % size] = 1
+            self._dirty.add(key)
+
+    def unblock(self, node: IntVector2) -> None:
+        """Make `node` traversable."""
+        size = self.chunk_size
+        key = (node.x // size, node.y // size)
+        chunk = self._chunk(key, create=False)
+        if chunk is not None:
+            chunk[(node.y % size) * size + node.x % size] = 0
+            self._dirty.add(key)
+
+    def neighbors(self, node: IntVector2) -> set[IntVector2]:
+        """Return the traversable neighbors of `node`."""
+        return {
+            neighbor
+            for neighbor in (node + offset for offset in Grid.DIRECTIONS)
+            if self.is_traversable(neighbor)
+        }
+
+    def route(
+        self,
+        from_node: IntVector2,
+        to_node: IntVector2,
+        *,
+        max_expansions: int = 100_000,
+    ) -> list[IntVector2] | None:
+        """Return a node-based route from `from_node` to `to_node`, by A* search.
+
+        Crosses chunk boundaries freely. Chunks are read, but not created.
+
+        `max_expansions`: nodes to expand before giving up, since on an
+        unbounded grid an unreachable node would otherwise be searched forever.
+
+        Returns:
+        --------
+        `list[IntVector2]`:
+            Nodes on the route `to_node`, of least cost.
+            Includes `from_node` and `to_node`.
+
+        `None`:
+            if no route was found within `max_expansions`.
+
+        """
+        if not self.is_traversable(to_node) and to_node != from_node:
+            return None
+
+        size = self.chunk_size
+        read_chunk = self._chunk_reader()
+        start, goal = (from_node.x, from_node.y), (to_node.x, to_node.y)
+        goal_x, goal_y = goal
+
+        def is_blocked(x: int, y: int) -> bool:
+            chunk = read_chunk((x // size, y // size))
+            return chunk is not None and bool(chunk[(y % size) * size + x % size])
+
+        came_from: dict[tuple[int, int], tuple[int, int] | None] = {start: None}
+        cost_so_far = {start: 0.0}
+        closed: set[tuple[int, int]] = set()
+        tie_breaker = itertools.count()
+        frontier = [(0.0, next(tie_breaker), start)]
+        while frontier and len(closed) < max_expansions:
+            current = heapq.heappop(frontier)[2]
+            if current in closed:
+                continue
+
+            closed.add(current)
+            if current == goal:
+                path = []
+                node: tuple[int, int] | None = current
+                while node is not None:
+                    path.append(IntVector2(*node))
+                    node = came_from[node]
+
+                return list(reversed(path))
+
+            x, y = current
+            current_cost = cost_so_far[current]
+            for dx, dy, step_cost in Grid.STEPS:
+                new = (x + dx, y + dy)
+                new_cost = current_cost + step_cost
+                if (
+                    new not in closed
+                    and new_cost < cost_so_far.get(new, math.inf)
+                    and not is_blocked(*new)
+                ):
+                    cost_so_far[new] = new_cost
+                    came_from[new] = current
+                    priority = new_cost + octile_length(
+                        new[0] - goal_x, new[1] - goal_y
+                    )
+                    heapq.heappush(frontier, (priority, next(tie_breaker), new))
+
+        return None
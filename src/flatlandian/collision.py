@@ -0,0 +1,147 @@
+"""Contains circle collision detection and response functions."""
+
+from __future__ import annotations
+
+import math
+import statistics
+from array import array
+from typing import TYPE_CHECKING
+
+from pygame.math import Vector2
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from flatlandian.entity import Entity
+
+_BUCKET_DIAMETERS = 3
+"""Broadphase bucket size, in median entity diameters.
+
+Larger buckets hold more pairs; smaller ones put each entity in more buckets.
+"""
+
+
+def _overlapped_buckets(
+    xs: Sequence[float], ys: Sequence[float], radii: Sequence[float], cell_size: float
+) -> dict[tuple[int, int], list[int]]:
+    """Return indices of circles in each bucket their bounding boxes overlap.
+
+    Circles without positive radius are left out. Indices in each bucket ascend.
+    """
+    floor = math.floor
+    buckets: dict[tuple[int, int], list[int]] = {}
+    for i, (x, y, r) in enumerate(zip(xs, ys, radii, strict=True)):
+        if r > 0:
+            min_by, max_by = floor((y - r) / cell_size), floor((y + r) / cell_size)
+            for bx in range(floor((x - r) / cell_size), floor((x + r) / cell_size) + 1):
+                for by in range(min_by, max_by + 1):
+                    buckets.setdefault((bx, by), []).append(i)
+
+    return buckets
+
+
+def find_contacts(entities: Sequence[Entity]) -> tuple[array[int], array[int]]:
+    """Return index pairs of overlapping `entities`, as two parallel arrays.
+
+    Broadphase: uniform grid of buckets sized from the median entity diameter;
+    each entity is in every bucket its bounding box overlaps, so a few large
+    entities don't make every bucket large. Narrowphase: exact circle-circle
+    test. Touching circles aren't in contact.
+
+    In each pair, the first index is less than the second.
+    """
+    first: array[int] = array("l")
+    second: array[int] = array("l")
+    if len(entities) < 2:  # noqa: PLR2004
+        return first, second
+
+    radii = [entity.radius for entity in entities]
+    cell_size = 2 * _BUCKET_DIAMETERS * (statistics.median(radii) or max(radii))
+    if cell_size <= 0:
+        return first, second
+
+    xs = [entity.position.x for entity in entities]
+    ys = [entity.position.y for entity in entities]
+    floor = math.floor
+    buckets = _overlapped_buckets(xs, ys, radii, cell_size)
+    for (bx, by), indices in buckets.items():
+        for n, i in enumerate(indices):
+            x, y, r = xs[i], ys[i], radii[i]
+            for j in indices[n + 1 :]:
+                dx = xs[j] - x
+                dy = ys[j] - y
+                min_distance = r + radii[j]
+                if (
+                    dx * dx + dy * dy < min_distance * min_distance
+                    # Report once: from the bucket holding the lower corner of
+                    # the overlap of their bounding boxes...
+                    and floor(max(x - r, xs[j] - radii[j]) / cell_size) == bx
+                    and floor(max(y - r, ys[j] - radii[j]) / cell_size) == by
+                ):
+                    first.append(i)
+                    second.append(j)
+
+    return first, second
+
+
+def resolve_contacts(
+    entities: Sequence[Entity],
+    contacts: tuple[array[int], array[int]],
+    *,
+    restitution: float = 1,
+) -> None:
+    """Separate overlapping `entities` and exchange velocity along contact normals.
+
+    Entities are treated as having equal mass.
+
+    `restitution`: 1 for perfectly elastic, 0 for perfectly inelastic.
+    """
+    for i, j in zip(*contacts, strict=True):
+        a, b = entities[i], entities[j]
+        delta = b.position - a.position
+        distance = delta.length()
+        normal = delta / distance if distance > 0 else Vector2(1, 0)
+
+        # Separation: each moves half the overlap along the normal...
+        overlap = a.radius + b.radius - distance
+        a.position = a.position - normal * (overlap / 2)
+        b.position = b.position + normal * (overlap / 2)
+
+        # Velocity response, only if approaching...
+        approach_speed = (b.velocity - a.velocity).dot(normal)
+        if approach_speed < 0:
+            impulse = normal * (-(1 + restitution) * approach_speed / 2)
+            a.velocity = a.velocity - impulse
+            b.velocity = b.velocity + impulse
+
+
+def contain(
+    entity: Entity, min_: Vector2, max_: Vector2, *, restitution: float = 1
+) -> bool:
+    """Keep `entity` wholly within the rectangle `min_`..`max_`.
+
+    An entity crossing an edge is moved back inside, and its velocity component
+    toward that edge is reflected, scaled by `restitution`.
+
+    Return whether `entity` was moved.
+    """
+    x, y = entity.position
+    vx, vy = entity.velocity
+    r = entity.radius
+    moved = False
+
+    if x - r < min_.x:
+        x, vx, moved = min_.x + r, math.fabs(vx) * restitution, True
+    elif x + r > max_.x:
+        x, vx, moved = max_.x - r, -math.fabs(vx) * restitution, True
+
+    if y - r < min_.y:
+        y, vy, moved = min_.y + r, math.fabs(vy) * restitution, True
+    elif y + r > max_.y:
+        y, vy, moved = max_.y - r, -math.fabs(vy) * restitution, True
+
+    if moved:
+        entity.position = Vector2(x, y)
+        entity.velocity = Vector2(vx, vy)
+
+    return moved
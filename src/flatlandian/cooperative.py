@@ -0,0 +1,221 @@
+"""Contains cooperative (space-time) route planning for many agents."""
+
+from __future__ import annotations
+
+import heapq
+import math
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from flatlandian.geometry import octile_distance
+from flatlandian.grid import Grid
+from flatlandian.int_vector2 import IntVector2
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from flatlandian.navigation_grid import NavigationGrid
+
+_MOVES = [*Grid.STEPS]
+_MOVES.append((0, 0, 1))  # wait
+
+
+@dataclass
+class ReservationTable:
+    """Reservations of grid cells by agents, at timesteps within a window.
+
+    Each reservation is a single `int` key/value pair; reservations at or beyond
+    `window` are discarded, so size is bounded by agents * `window`.
+    """
+
+    size: IntVector2
+    """Size of the reserved grid."""
+    window: int = 16
+    """Number of timesteps, from 0, that can be reserved."""
+    _owners: dict[int, int] = field(init=False, default_factory=dict, repr=False)
+
+    def __len__(self) -> int:
+        return len(self._owners)
+
+    def _key(self, cell: IntVector2, timestep: int) -> int:
+        return (timestep * self.size.y + cell.y) * self.size.x + cell.x
+
+    def reserve(self, cell: IntVector2, timestep: int, agent: int) -> None:
+        """Reserve `cell` at `timestep` for `agent`, if within the window.
+
+        Raises `ValueError` if another agent has already reserved it.
+        """
+        if 0 <= timestep < self.window:
+            key = self._key(cell, timestep)
+            owner = self._owners.setdefault(key, agent)
+            if owner != agent:
+                err_msg = (
+                    f"Can't reserve {cell} at timestep {timestep} for agent {agent}: "
+                    f"reserved by agent {owner}"
+                )
+                raise ValueError(err_msg)
+
+    def owner(self, cell: IntVector2, timestep: int) -> int | None:
+        """Return the agent that has reserved `cell` at `timestep`, if any."""
+        return self._owners.get(self._key(cell, timestep))
+
+    def is_free(self, cell: IntVector2, timestep: int, agent: int) -> bool:
+        """Return whether `cell` at `timestep` is unreserved or reserved by `agent`."""
+        return self._owners.get(self._key(cell, timestep), agent) == agent
+
+    def clear(self) -> None:
+        """Remove all reservations."""
+        self._owners.clear()
+
+
+def _plan_in_window(
+    grid: NavigationGrid,
+    table: ReservationTable,
+    agent: int,
+    start_node: IntVector2,
+    goal_node: IntVector2,
+) -> list[IntVector2] | None:
+    """Return a space-time route avoiding reservations, one node per timestep.
+
+    Ends at `goal_node`, or at the last timestep in the window, so every step is
+    checked against reservations. `None` if none was found.
+    Only ends at `goal_node` if it's free for the rest of the window, so the
+    agent can stay there.
+    """
+    window = table.window
+    # Heap entries: (priority, index into `states`, cost, timestep)...
+    states: list[tuple[IntVector2, int]] = [(start_node, 0)]
+    frontier = [(octile_distance(start_node, goal_node), 0, 0.0, 0)]
+    came_from: dict[tuple[IntVector2, int], tuple[IntVector2, int] | None] = {
+        (start_node, 0): None
+    }
+    cost_so_far = {(start_node, 0): 0.0}
+    closed: set[tuple[IntVector2, int]] = set()
+    end: tuple[IntVector2, int] | None = None
+
+    while frontier:
+        _, state_index, cost, timestep = heapq.heappop(frontier)
+        state = states[state_index]
+        if state in closed:
+            continue
+
+        closed.add(state)
+        node = state[0]
+        if timestep == window - 1 or (
+            node == goal_node
+            and all(table.is_free(node, t, agent) for t in range(timestep + 1, window))
+        ):
+            end = state
+            break
+
+        next_timestep = timestep + 1
+        for dx, dy, step_cost in _MOVES:
+            new_node = IntVector2(node.x + dx, node.y + dy)
+            if not grid.is_traversable(new_node) or not table.is_free(
+                new_node, next_timestep, agent
+            ):
+                continue
+
+            # Don't swap places with another agent...
+            other = table.owner(new_node, timestep)
+            if (
+                other is not None
+                and other != agent
+                and table.owner(node, next_timestep) == other
+            ):
+                continue
+
+            new_state = (new_node, next_timestep)
+            new_cost = cost + step_cost
+            if new_state not in closed and new_cost < cost_so_far.get(
+                new_state, math.inf
+            ):
+                cost_so_far[new_state] = new_cost
+                came_from[new_state] = state
+                states.append(new_state)
+                priority = new_cost + octile_distance(new_node, goal_node)
+                heapq.heappush(
+                    frontier,
+                    (priority, len(states) - 1, new_cost, next_timestep),
+                )
+
+    if end is None:
+        return None
+
+    path: list[IntVector2] = []
+    current: tuple[IntVector2, int] | None = end
+    while current is not None and current[1] > 0:
+        path.append(current[0])
+        current = came_from[current]
+
+    path.reverse()
+    return path
+
+
+def plan_cooperative_routes(
+    grid: NavigationGrid,
+    agents: Sequence[tuple[IntVector2, IntVector2]],
+    *,
+    window: int = 16,
+) -> list[list[IntVector2] | None]:
+    """Return routes for `agents` that avoid each other, planned in sequence.
+
+    Windowed cooperative A*: each agent's route avoids cells reserved by
+    previously planned agents, and swapping places with them. Routes are planned
+    `window` timesteps ahead at most, which bounds the cost per agent; replan
+    before agents reach the end of a partial route.
+
+    Parameters:
+    -----------
+    `agents`: `(from_node, to_node)` for each agent, in planning priority order.
+
+    Returns:
+    --------
+    For each agent:
+
+    `list[IntVector2]`:
+        Nodes on the route, one per timestep; a repeated node is a wait.
+        Ends at `to_node`, or partway after `window - 1` timesteps.
+        Doesn't include `from_node`.
+
+    `None`:
+        if no route was found. Other agents avoid `from_node`, where it's
+        expected to stay; except previously planned agents that pass through
+        it, which aren't replanned.
+
+    """
+    table = ReservationTable(grid.size, window)
+    for agent, (from_node, to_node) in enumerate(agents):
+        # Agents that can't reach their goal stay at `from_node` throughout...
+        held = 1 if grid.is_traversable(to_node) else window
+        for timestep in range(held):
+            table.reserve(from_node, timestep, agent)
+
+    routes: list[list[IntVector2] | None] = []
+    for agent, (from_node, to_node) in enumerate(agents):
+        if not grid.is_traversable(to_node):
+            routes.append(None)
+            continue
+
+        path = _plan_in_window(grid, table, agent, from_node, to_node)
+        if path is None:
+            # Stays at `from_node`, except where a previously planned agent
+            # already passes through it...
+            for timestep in range(1, window):
+                if table.is_free(from_node, timestep, agent):
+                    table.reserve(from_node, timestep, agent)
+
+            routes.append(None)
+            continue
+
+        for timestep, node in enumerate(path, start=1):
+            table.reserve(node, timestep, agent)
+
+        # Stay at the end of the route for the rest of the window...
+        last_node = path[-1] if path else from_node
+        for timestep in range(len(path) + 1, window):
+            table.reserve(last_node, timestep, agent)
+
+        routes.append(path)
+
+    return routes
@@ -3,20 +3,26 @@
 from __future__ import annotations
 
 import itertools
+import math
 from statistics import fmean
 from typing import TYPE_CHECKING
 
-from pygame import Rect
-from pygame.math import Vector2
-
 from flatlandian.int_vector2 import IntVector2
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
+    from pygame import Rect
+    from pygame.math import Vector2
+
+_SQRT_2_MINUS_1 = math.sqrt(2) - 1
+
 
 def mean_vector(vec2s: Iterable[Vector2]) -> Vector2:
     """Return mean vector of `vec2s`."""
+    # Imported here, so that importing `geometry` doesn't import Pygame...
+    from pygame.math import Vector2  # noqa: PLC0415
+
     return Vector2(fmean(vec.x for vec in vec2s), fmean(vec.y for vec in vec2s))
 
 
@@ -44,6 +50,20 @@ def relative_bearing(bearing1: float, bearing2: float) -> float:
     return 180 if bearing == -180 else bearing  # noqa: PLR2004
 
 
+def octile_distance(cell1: IntVector2, cell2: IntVector2) -> float:
+    """Return the shortest distance between cells, moving in 8 directions.
+
+    Cardinal steps cost 1; diagonal steps cost sqrt(2).
+    """
+    return octile_length(cell1.x - cell2.x, cell1.y - cell2.y)
+
+
+def octile_length(dx: int, dy: int) -> float:
+    """Return the octile distance covered by offset `(dx, dy)`."""
+    dx, dy = abs(dx), abs(dy)
+    return max(dx, dy) + _SQRT_2_MINUS_1 * min(dx, dy)
+
+
 def cells_in_rect(rect: Rect) -> set[IntVector2]:
     """Return all cells in `rect`."""
     return {
@@ -57,11 +77,9 @@ def cells_in_rect(rect: Rect) -> set[IntVector2]:
 
 def cells_in_circle(*, center: IntVector2, radius: int) -> set[IntVector2]:
     """Return all cells in the circle."""
-    rect = Rect(center.x - radius, center.y - radius, radius * 2, radius * 2).inflate(
-        1, 1
-    )
+    offsets = range(-radius, radius + 1)
     return {
-        cell
-        for cell in cells_in_rect(rect)
-        if (cell - center).as_vector2.length_squared() < radius**2
+        IntVector2(center.x + dx, center.y + dy)
+        for dx, dy in itertools.product(offsets, offsets)
+        if dx * dx + dy * dy < radius * radius
     }
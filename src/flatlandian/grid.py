@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import itertools
-from dataclasses import dataclass, field
+import math
+from dataclasses import dataclass
+from functools import cached_property
 from typing import ClassVar
 
 from flatlandian.int_vector2 import IntVector2
@@ -27,12 +29,20 @@ class Grid:
         ]
     ]
 
+    STEPS: ClassVar = [
+        (dir_.x, dir_.y, math.hypot(dir_.x, dir_.y)) for dir_ in DIRECTIONS
+    ]
+    """`(dx, dy, cost)` of each move in `DIRECTIONS`."""
+
     size: IntVector2
-    cells: frozenset[IntVector2] = field(init=False, default_factory=frozenset)
-    """All potentially traversable nodes."""
 
-    def __post_init__(self) -> None:
-        self.cells = frozenset(
+    @cached_property
+    def cells(self) -> frozenset[IntVector2]:
+        """All potentially traversable nodes.
+
+        Built on first access, so construction is cheap for large grids.
+        """
+        return frozenset(
             IntVector2(x, y)
             for x, y in itertools.product(range(self.size.x), range(self.size.y))
         )
@@ -5,11 +5,10 @@ from __future__ import annotations
 from dataclasses import dataclass, fields
 from typing import TYPE_CHECKING
 
-from pygame.math import Vector2
-
 if TYPE_CHECKING:
     from collections.abc import Sized
 
+    from pygame.math import Vector2
     from pygame.typing import IntPoint
 
 
@@ -76,6 +75,9 @@ class IntVector2:
 
         For compatibility with Pygame functions.
         """
+        # Imported here, so that importing `IntVector2` doesn't import Pygame...
+        from pygame.math import Vector2  # noqa: PLC0415
+
         return Vector2(self.x, self.y)
 
     def __repr__(self) -> str:
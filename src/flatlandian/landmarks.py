@@ -0,0 +1,130 @@
+"""Contains `Landmarks` class, for ALT (A*, landmarks, triangle inequality) search."""
+
+from __future__ import annotations
+
+import math
+import struct
+import sys
+import zlib
+from array import array
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from flatlandian.int_vector2 import IntVector2
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from pathlib import Path
+
+_MAGIC = b"FLLM"
+_HEADER = struct.Struct("<4sIIII")
+"""Magic, width, height, landmark count, map checksum."""
+_NODE = struct.Struct("<II")
+
+
+def map_checksum(size: IntVector2, blocked_nodes: Iterable[IntVector2]) -> int:
+    """Return checksum identifying a map by its size and blocked nodes."""
+    indices = sorted(node.y * size.x + node.x for node in blocked_nodes)
+    return zlib.crc32(array("q", [size.x, size.y, *indices]).tobytes())
+
+
+def _to_little_endian(values: array[float]) -> bytes:
+    if sys.byteorder == "little":
+        return values.tobytes()
+
+    swapped = array(values.typecode, values)
+    swapped.byteswap()
+    return swapped.tobytes()
+
+
+@dataclass(frozen=True)
+class Landmarks:
+    """Precomputed distances from landmark nodes to every node of a map.
+
+    By the triangle inequality, `|d(L, goal) - d(L, node)|` for each landmark
+    `L` is a lower bound on the distance from node to goal: an A* heuristic
+    that's much better informed than straight-line distance around obstacles.
+
+    Valid while the map's blocked nodes are unchanged or only added to.
+    """
+
+    size: IntVector2
+    """Size of the map."""
+    nodes: tuple[IntVector2, ...]
+    """Landmark nodes."""
+    distances: tuple[array[float], ...]
+    """For each landmark, distance to each node, indexed by `y * size.x + x`.
+
+    `math.inf` where unreachable.
+    """
+    checksum: int
+    """`map_checksum` of the map when preprocessed."""
+
+    def heuristic(self, goal: int) -> Callable[[int], float]:
+        """Return lower bound function of distance from node index to `goal` index."""
+        columns = [
+            (distances, distances[goal])
+            for distances in self.distances
+            if distances[goal] < math.inf
+        ]
+
+        def lower_bound(index: int) -> float:
+            bound = 0.0
+            for distances, goal_distance in columns:
+                distance = distances[index]
+                if distance < math.inf:
+                    bound = max(bound, abs(goal_distance - distance))
+
+            return bound
+
+        return lower_bound
+
+    def to_bytes(self) -> bytes:
+        """Return compact binary representation."""
+        header = _HEADER.pack(
+            _MAGIC, self.size.x, self.size.y, len(self.nodes), self.checksum
+        )
+        nodes = b"".join(_NODE.pack(node.x, node.y) for node in self.nodes)
+        distances = b"".join(_to_little_endian(values) for values in self.distances)
+        return header + nodes + distances
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Landmarks:
+        """Construct `Landmarks` from `to_bytes` representation."""
+        magic, width, height, count, checksum = _HEADER.unpack_from(data)
+        if magic != _MAGIC:
+            err_msg = "Not landmarks data"
+            raise ValueError(err_msg)
+
+        offset = _HEADER.size
+        nodes = tuple(
+            IntVector2(*_NODE.unpack_from(data, offset + i * _NODE.size))
+            for i in range(count)
+        )
+        offset += count * _NODE.size
+        cell_count = width * height
+        expected_length = offset + count * cell_count * 8
+        if len(data) != expected_length:
+            err_msg = f"Expected {expected_length} bytes, got {len(data)}"
+            raise ValueError(err_msg)
+
+        distances = []
+        for i in range(count):
+            values = array("d")
+            start = offset + i * cell_count * 8
+            values.frombytes(data[start : start + cell_count * 8])
+            if sys.byteorder != "little":
+                values.byteswap()
+
+            distances.append(values)
+
+        return cls(IntVector2(width, height), nodes, tuple(distances), checksum)
+
+    def save(self, path: Path) -> None:
+        """Save to file at `path`."""
+        path.write_bytes(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: Path) -> Landmarks:
+        """Load from file at `path`."""
+        return cls.from_bytes(path.read_bytes())
@@ -3,79 +3,578 @@
 from __future__ import annotations
 
 import heapq
+import itertools
 import math
+import time
+from array import array
+from collections.abc import Set as AbstractSet
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
+from flatlandian.geometry import octile_length
 from flatlandian.grid import Grid
 from flatlandian.int_vector2 import IntVector2
+from flatlandian.landmarks import Landmarks, map_checksum
+from flatlandian.visibility import FieldOfView, field_of_view, has_line_of_sight
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+    from pathlib import Path
 
 _SQRT_2 = math.sqrt(2)
 
+_BIDIRECTIONAL_ALGORITHMS = {
+    "BIDIRECTIONAL_UNIFORM_COST_SEARCH",
+    "BIDIRECTIONAL_A_STAR",
+}
+
+_ALGORITHMS = {"UNIFORM_COST_SEARCH", "A_STAR", *_BIDIRECTIONAL_ALGORITHMS}
+
+_STOP_CHECK_INTERVAL = 64
+"""Nodes expanded between `should_stop` checks."""
+
+
+@dataclass(kw_only=True)
+class SearchStats:
+    """Counters from a route search. Pass to `NavigationGrid.route` to populate."""
+
+    nodes_expanded: int = 0
+    """Nodes taken from the frontier and their neighbors examined."""
+    nodes_pushed: int = 0
+    """Nodes added to the frontier, including re-additions at lower cost."""
+    peak_frontier: int = 0
+    """Largest size of the frontier."""
+    elapsed: float = 0
+    """Search wall time, in seconds."""
+    early_exit: bool = False
+    """Whether the search stopped on reaching the goal."""
+
+    def record(
+        self,
+        *,
+        nodes_expanded: int,
+        nodes_pushed: int,
+        peak_frontier: int,
+        start_time: float,
+        early_exit: bool,
+    ) -> None:
+        """Record counters at the end of a search started at `start_time`."""
+        self.nodes_expanded = nodes_expanded
+        self.nodes_pushed = nodes_pushed
+        self.peak_frontier = peak_frontier
+        self.elapsed = time.perf_counter() - start_time
+        self.early_exit = early_exit
+
+
+def _join_came_from(
+    forward: dict[int, int], backward: dict[int, int], meeting_node: int
+) -> None:
+    """Join backward search links onto `forward`, from `meeting_node` to the goal."""
+    previous, current = meeting_node, backward[meeting_node]
+    while current != -1:
+        forward[current] = previous
+        previous, current = current, backward[current]
+
+
+def _closest(
+    closed: set[int], cost_so_far: dict[int, float], width: int, start: int, goal: int
+) -> int:
+    """Return the node index in `closed` nearest `goal`; `start` if none.
+
+    Nearest by octile distance; then by cost from start.
+    """
+    goal_y, goal_x = divmod(goal, width)
+
+    def key(index: int) -> tuple[float, float]:
+        y, x = divmod(index, width)
+        return octile_length(x - goal_x, y - goal_y), cost_so_far[index]
+
+    return min(closed, key=key, default=start)
+
 
 @dataclass(kw_only=True)
-class _PrioritisedNode:
-    """Wrapper for prioritised node.
+class _Search:
+    """Resumable uniform cost search; A* search if `heuristic` is provided.
 
-    Avoids unintended prioritisation attempts on `node` itself.
+    Nodes are indexed by `y * size.x + x`.
     """
 
-    node: IntVector2
-    priority: float
+    index_neighbors: Callable[[int], Iterable[tuple[int, float]]]
+    """Return `(index, cost)` of reachable neighbors of a node index."""
+    node_at: Callable[[int], IntVector2]
+    """Return node at index."""
+    width: int
+    start: int
+    goal: int
+    heuristic: Callable[[int], float] | None = None
+    """Lower bound of cost from node index to `goal`."""
+    on_expand: Callable[[IntVector2], None] | None = None
+    instrumented: bool = False
+    """Whether to track `peak_frontier` and call `on_expand`."""
+
+    came_from: dict[int, int] = field(init=False)
+    """Start node maps to -1."""
+    cost_so_far: dict[int, float] = field(init=False)
+    closed: set[int] = field(init=False, default_factory=set)
+    frontier: list[tuple[float, int, int]] = field(init=False)
+    """Heap entries: (priority, tie-breaker, node index)."""
+    tie_breaker: Iterator[int] = field(init=False, default_factory=itertools.count)
+    nodes_expanded: int = field(init=False, default=0)
+    nodes_pushed: int = field(init=False, default=0)
+    peak_frontier: int = field(init=False, default=0)
+    found: bool = field(init=False, default=False)
+    """Whether `goal` has been reached."""
+
+    def __post_init__(self) -> None:
+        self.came_from = {self.start: -1}
+        self.cost_so_far = {self.start: 0}
+        self.frontier = [(0, next(self.tie_breaker), self.start)]
+
+    @property
+    def is_done(self) -> bool:
+        """Whether `goal` has been reached, or can't be."""
+        return self.found or not self.frontier
+
+    def step(self, budget: float = math.inf) -> bool:
+        """Expand up to `budget` nodes. Return `is_done`."""
+        # Instrumentation costs one local check per node when disabled...
+        instrumented, on_expand, heuristic = (
+            self.instrumented,
+            self.on_expand,
+            self.heuristic,
+        )
+        came_from, cost_so_far = self.came_from, self.cost_so_far
+        closed, frontier, tie_breaker = self.closed, self.frontier, self.tie_breaker
+        index_neighbors = self.index_neighbors
+        expanded = pushed = 0
+
+        while frontier and expanded < budget:
+            current = heapq.heappop(frontier)[2]
+            if current in closed:  # stale entry, superseded by a cheaper one
+                continue
+
+            closed.add(current)
+            if current == self.goal:  # early exit
+                self.found = True
+                break
+
+            current_cost = cost_so_far[current]
+            for new, step_cost in index_neighbors(current):
+                new_cost = current_cost + step_cost
+                if new not in closed and new_cost < cost_so_far.get(new, math.inf):
+                    cost_so_far[new] = new_cost
+                    came_from[new] = current
+                    priority = new_cost + (0 if heuristic is None else heuristic(new))
+                    heapq.heappush(frontier, (priority, next(tie_breaker), new))
+                    pushed += 1
+
+            expanded += 1
+            if instrumented:
+                self.peak_frontier = max(self.peak_frontier, len(frontier))
+                if on_expand is not None:
+                    on_expand(self.node_at(current))
 
-    def __lt__(self, other: _PrioritisedNode) -> bool:
-        """Determine priority for `heapq`."""
-        return self.priority < other.priority
+        self.nodes_expanded += expanded
+        self.nodes_pushed += pushed
+        return self.is_done
+
+    def closest(self) -> int:
+        """Return the expanded node index nearest `goal`, for a best-effort route."""
+        if self.found:
+            return self.goal
+
+        return _closest(
+            self.closed, self.cost_so_far, self.width, self.start, self.goal
+        )
 
 
 @dataclass(kw_only=True)
-class _PriorityQueue:
-    """Simple priority queue, using `heapq`. Specialised for holding nodes."""
+class _BidirectionalSearch:
+    """Resumable bidirectional uniform cost search; A* if `potential` is provided.
+
+    Searches from both ends, expanding whichever frontier has the lower minimum
+    priority. Done when the sum of the frontiers' minimum priorities reaches the
+    cheapest route found so far, which is then optimal.
+
+    Nodes are indexed by `y * size.x + x`.
+    """
+
+    index_neighbors: Callable[[int], Iterable[tuple[int, float]]]
+    """Return `(index, cost)` of reachable neighbors of a node index."""
+    node_at: Callable[[int], IntVector2]
+    """Return node at index."""
+    width: int
+    start: int
+    goal: int
+    potential: Callable[[int], float] | None = None
+    """Added to forward priorities and subtracted from backward ones, for A*
+    search; see `NavigationGrid._average_potential`."""
+    on_expand: Callable[[IntVector2], None] | None = None
+    instrumented: bool = False
+    """Whether to track `peak_frontier` and call `on_expand`."""
+
+    came_from: dict[int, int] = field(init=False)
+    """Forward search links; start node maps to -1. Once `found`, joined with
+    the backward search's links through to `goal`."""
+    backward_came_from: dict[int, int] = field(init=False)
+    """Goal node maps to -1."""
+    cost_so_far: tuple[dict[int, float], dict[int, float]] = field(init=False)
+    """Per direction, 0: forward, 1: backward."""
+    closed: tuple[set[int], set[int]] = field(init=False)
+    frontiers: tuple[list[tuple[float, int, int]], list[tuple[float, int, int]]] = (
+        field(init=False)
+    )
+    """Heap entries: (priority, tie-breaker, node index)."""
+    tie_breaker: Iterator[int] = field(
+        init=False, default_factory=lambda: itertools.count(1)
+    )
+    best_cost: float = field(init=False)
+    """Cost of the cheapest route found so far."""
+    meeting_node: int = field(init=False)
+    """Node index on the cheapest route found so far, reached from both ends."""
+    nodes_expanded: int = field(init=False, default=0)
+    nodes_pushed: int = field(init=False, default=0)
+    peak_frontier: int = field(init=False, default=0)
+    is_done: bool = field(init=False, default=False)
+    """Whether the cheapest route has been found, or there's none."""
+    found: bool = field(init=False, default=False)
+    """Whether the cheapest route has been found."""
+
+    def __post_init__(self) -> None:
+        potential, start, goal = self.potential, self.start, self.goal
+        self.came_from = {start: -1}
+        self.backward_came_from = {goal: -1}
+        self.cost_so_far = ({start: 0}, {goal: 0})
+        self.closed = (set(), set())
+        self.frontiers = (
+            [(0 if potential is None else potential(start), 0, start)],
+            [(0 if potential is None else -potential(goal), 0, goal)],
+        )
+        self.best_cost = 0 if start == goal else math.inf
+        self.meeting_node = start
+
+    def step(self, budget: float = math.inf) -> bool:
+        """Expand up to `budget` nodes. Return `is_done`."""
+        if self.is_done:
+            return True
+
+        instrumented, on_expand, potential = (
+            self.instrumented,
+            self.on_expand,
+            self.potential,
+        )
+        came_froms = (self.came_from, self.backward_came_from)
+        cost_so_far, closed, frontiers = self.cost_so_far, self.closed, self.frontiers
+        tie_breaker, index_neighbors = self.tie_breaker, self.index_neighbors
+        best_cost, meeting_node = self.best_cost, self.meeting_node
+        expanded = pushed = 0
+
+        while expanded < budget:
+            if not (
+                frontiers[0]
+                and frontiers[1]
+                and frontiers[0][0][0] + frontiers[1][0][0] < best_cost
+            ):
+                self._finish(best_cost, meeting_node)
+                break
+
+            direction = int(frontiers[1][0][0] < frontiers[0][0][0])
+            sign = 1 - 2 * direction
+            own_came_from = came_froms[direction]
+            own_cost_so_far = cost_so_far[direction]
+            own_closed = closed[direction]
+            other_cost_so_far = cost_so_far[1 - direction]
+
+            current = heapq.heappop(frontiers[direction])[2]
+            if current in own_closed:  # stale entry, superseded by a cheaper one
+                continue
+
+            own_closed.add(current)
+            current_cost = own_cost_so_far[current]
+            for new, step_cost in index_neighbors(current):
+                new_cost = current_cost + step_cost
+                if new not in own_closed and new_cost < own_cost_so_far.get(
+                    new, math.inf
+                ):
+                    own_cost_so_far[new] = new_cost
+                    own_came_from[new] = current
+                    priority = (
+                        new_cost
+                        if potential is None
+                        else new_cost + sign * potential(new)
+                    )
+                    heapq.heappush(
+                        frontiers[direction], (priority, next(tie_breaker), new)
+                    )
+                    pushed += 1
+
+                # Check for a cheaper route via `new`...
+                if new_cost + other_cost_so_far.get(new, math.inf) < best_cost:
+                    best_cost = new_cost + other_cost_so_far[new]
+                    meeting_node = new
+
+            expanded += 1
+            if instrumented:
+                self.peak_frontier = max(self.peak_frontier, sum(map(len, frontiers)))
+                if on_expand is not None:
+                    on_expand(self.node_at(current))
+
+        self.best_cost, self.meeting_node = best_cost, meeting_node
+        self.nodes_expanded += expanded
+        self.nodes_pushed += pushed
+        return self.is_done
+
+    def _finish(self, best_cost: float, meeting_node: int) -> None:
+        """Mark done; if a route was found, join `came_from` through to `goal`."""
+        self.is_done = True
+        self.found = best_cost < math.inf
+        if self.found:
+            _join_came_from(self.came_from, self.backward_came_from, meeting_node)
+
+    def closest(self) -> int:
+        """Return the expanded node index nearest `goal`, for a best-effort route.
+
+        Only the forward search's nodes are considered, until `found`.
+        """
+        if self.found:
+            return self.goal
+
+        return _closest(
+            self.closed[0], self.cost_so_far[0], self.width, self.start, self.goal
+        )
+
+
+@dataclass(frozen=True, eq=False, repr=False)
+class _NodeSet(AbstractSet[IntVector2]):
+    """Read-only set of nodes, backed by a set of node indices.
+
+    Nodes are indexed by `y * size.x + x`.
+    """
 
-    items: list[_PrioritisedNode] = field(init=False, default_factory=list)
+    indices: set[int]
+    size: IntVector2
+
+    def __contains__(self, node: object) -> bool:
+        size = self.size
+        return (
+            isinstance(node, IntVector2)
+            and 0 <= node.x < size.x
+            and 0 <= node.y < size.y
+            and node.y * size.x + node.x in self.indices
+        )
+
+    def __iter__(self) -> Iterator[IntVector2]:
+        width = self.size.x
+        for index in self.indices:
+            y, x = divmod(index, width)
+            yield IntVector2(x, y)
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def __repr__(self) -> str:
+        return repr(set(self))
+
+
+@dataclass
+class RouteSearch:
+    """A route search that runs a limited number of node expansions at a time.
+
+    Lets long searches be spread over frames at a bounded cost per frame.
+    Create with `NavigationGrid.start_route`.
+    """
+
+    from_node: IntVector2
+    to_node: IntVector2
+    _search: _Search | _BidirectionalSearch | None = field(repr=False)
+    """`None` if cancelled, or if there's no route to search for."""
+    _path: Callable[[dict[int, int], int], list[IntVector2]] = field(repr=False)
+    _result: list[IntVector2] | None = field(init=False, default=None, repr=False)
+
+    @property
+    def is_done(self) -> bool:
+        """Whether the search has finished, or been cancelled."""
+        return self._search is None or self._search.is_done
+
+    @property
+    def nodes_expanded(self) -> int:
+        """Nodes expanded so far."""
+        return 0 if self._search is None else self._search.nodes_expanded
 
     @property
-    def is_empty(self) -> bool:
-        """Check whether the queue is empty."""
-        return not self.items
+    def result(self) -> list[IntVector2] | None:
+        """The route, as returned by `NavigationGrid.route`, once `is_done`.
+
+        `None` while searching, if cancelled, or if no route was found.
+        """
+        search = self._search
+        if self._result is None and search is not None and search.found:
+            self._result = self._path(search.came_from, search.goal)
 
-    def put(self, priority: float, node: IntVector2) -> None:
-        """Add a node with priority."""
-        heapq.heappush(self.items, _PrioritisedNode(priority=priority, node=node))
+        return self._result
 
-    def get(self) -> IntVector2:
-        """Remove and return the highest priority node.
+    def best_effort(self) -> list[IntVector2] | None:
+        """Return `result` if found; otherwise a route found so far.
 
-        NB this is the lowest `priority` value.
+        The route ends at the expanded node nearest `to_node`, as `route` returns
+        when stopped early. `None` if cancelled, or if no route exists.
         """
-        return heapq.heappop(self.items).node
+        search = self._search
+        if search is None or search.found:
+            return self.result
+
+        if search.is_done:  # exhausted: no route
+            return None
+
+        return self._path(search.came_from, search.closest())
+
+    def step(self, budget: int) -> bool:
+        """Expand up to `budget` nodes. Return `is_done`."""
+        if self._search is not None:
+            self._search.step(budget)
+
+        return self.is_done
+
+    def cancel(self) -> None:
+        """Stop the search, and release its memory."""
+        if not (self._search is not None and self._search.found):
+            self._search = None
 
 
 @dataclass
 class NavigationGrid(Grid):
     """A rectangular navigable grid."""
 
-    nodes: frozenset[IntVector2] = field(init=False, default_factory=frozenset)
-    """All potentially traversable nodes."""
-    blocked_nodes: set[IntVector2] = field(init=False, default_factory=set)
-    """Subset of `nodes` that cannot currently be traversed."""
+    _blocked_indices: set[int] = field(init=False, default_factory=set, repr=False)
+    """Indices of blocked nodes, `y * size.x + x`."""
+    landmarks: Landmarks | None = field(init=False, default=None, repr=False)
+    """Precomputed landmark distances, for `"A_STAR"` search heuristic.
 
-    def __post_init__(self) -> None:
-        super().__post_init__()
-        self.nodes = self.cells
+    See `preprocess_landmarks`, `load_landmarks`.
+    Cleared by `unblock`, and by assigning `blocked_nodes`.
+    """
+    _fields_of_view: dict[tuple[IntVector2, int], FieldOfView] = field(
+        init=False, default_factory=dict, repr=False
+    )
+
+    @property
+    def nodes(self) -> frozenset[IntVector2]:
+        """All potentially traversable nodes. Same as `cells`."""
+        return self.cells
+
+    @property
+    def blocked_nodes(self) -> AbstractSet[IntVector2]:
+        """Subset of `nodes` that cannot currently be traversed. Read-only.
+
+        Change with `block`/`unblock`, or by assigning a new set, which clears
+        cached views and `landmarks`.
+        """
+        return _NodeSet(self._blocked_indices, self.size)
+
+    @blocked_nodes.setter
+    def blocked_nodes(self, value: AbstractSet[IntVector2]) -> None:
+        for node in value:
+            self._check_in_bounds(node)
+
+        width = self.size.x
+        self._blocked_indices = {node.y * width + node.x for node in value}
+        self._fields_of_view.clear()
+        self.landmarks = None
 
     def is_traversable(self, node: IntVector2) -> bool:
         """Return `True` if the node is traversable, else `False`."""
-        return node in self.nodes and node not in self.blocked_nodes
+        return (
+            self.is_in_bounds(node)
+            and node.y * self.size.x + node.x not in self._blocked_indices
+        )
+
+    def _check_in_bounds(self, node: IntVector2) -> None:
+        if not self.is_in_bounds(node):
+            err_msg = f"Node {node} is out of bounds of grid of size {self.size}"
+            raise ValueError(err_msg)
+
+    def block(self, node: IntVector2) -> None:
+        """Add `node` to `blocked_nodes`, invalidating affected cached views.
+
+        Raises `ValueError` if `node` is out of bounds.
+        """
+        self._check_in_bounds(node)
+        self._blocked_indices.add(node.y * self.size.x + node.x)
+        self._invalidate_fields_of_view(node)
+
+    def unblock(self, node: IntVector2) -> None:
+        """Remove `node` from `blocked_nodes`, invalidating affected cached views.
+
+        Clears `landmarks`, which may then overestimate distances.
+        """
+        if node in self.blocked_nodes:
+            self._blocked_indices.discard(node.y * self.size.x + node.x)
+            self.landmarks = None
+
+        self._invalidate_fields_of_view(node)
+
+    def _invalidate_fields_of_view(self, node: IntVector2) -> None:
+        """Remove cached fields of view with `node` inside their radius."""
+        self._fields_of_view = {
+            (origin, radius): view
+            for (origin, radius), view in self._fields_of_view.items()
+            if (node.x - origin.x) ** 2 + (node.y - origin.y) ** 2 >= radius**2
+        }
+
+    def clear_visibility_cache(self) -> None:
+        """Remove all cached fields of view.
+
+        Not normally required: `block`, `unblock` and assigning `blocked_nodes`
+        invalidate cached views.
+        """
+        self._fields_of_view.clear()
+
+    def _is_opaque(self, x: int, y: int) -> bool:
+        """Return whether cell (`x`, `y`) blocks sight: blocked or out of bounds."""
+        width, height = self.size.x, self.size.y
+        if not (0 <= x < width and 0 <= y < height):
+            return True
+
+        return y * width + x in self._blocked_indices
+
+    def has_line_of_sight(self, node1: IntVector2, node2: IntVector2) -> bool:
+        """Return whether no blocked node lies on the line between the nodes.
+
+        See `visibility.has_line_of_sight`.
+        """
+        return has_line_of_sight(node1, node2, self._is_opaque)
+
+    def visible_cells(self, origin: IntVector2, radius: int) -> FieldOfView:
+        """Return nodes visible from `origin` within `radius`, by shadowcasting.
+
+        Cached per `origin` and `radius`; see `block`, `unblock`.
+        """
+        key = (origin, radius)
+        view = self._fields_of_view.get(key)
+        if view is None:
+            view = field_of_view(origin, radius, self._is_opaque, size=self.size)
+            self._fields_of_view[key] = view
+
+        return view
 
-    def _reachable_neighbors(self, node: IntVector2) -> set[IntVector2]:
-        """Return `node`'s reachable (by movement) neighbors."""
-        reachable_neighbors: set[IntVector2] = set()
-        for dir_ in Grid.DIRECTIONS:
-            neighbor = IntVector2(node.x + dir_.x, node.y + dir_.y)
-            if self.is_traversable(neighbor):
-                reachable_neighbors.add(neighbor)
+    def _node_at(self, index: int) -> IntVector2:
+        """Return node at `index`, i.e. `y * size.x + x`."""
+        y, x = divmod(index, self.size.x)
+        return IntVector2(x, y)
 
-        return reachable_neighbors
+    def _index_neighbors(self, index: int) -> Iterator[tuple[int, float]]:
+        """Yield `(index, cost)` of reachable neighbors of node at `index`.
+
+        Nodes are indexed by `y * size.x + x`.
+        """
+        width, height = self.size.x, self.size.y
+        blocked_indices = self._blocked_indices
+        y, x = divmod(index, width)
+        for dx, dy, step_cost in Grid.STEPS:
+            if 0 <= x + dx < width and 0 <= y + dy < height:
+                neighbor = index + dy * width + dx
+                if neighbor not in blocked_indices:
+                    yield neighbor, step_cost
 
     def cost(self, from_node: IntVector2, to_node: IntVector2) -> float:
         """Calculate the cost from node to a neighbor.
@@ -94,68 +593,289 @@ class NavigationGrid(Grid):
 
         return 1
 
-    def _search(
-        self,
-        start_node: IntVector2,
-        goal_node: IntVector2,
-    ) -> dict[IntVector2, IntVector2 | None]:
-        came_from: dict[IntVector2, IntVector2 | None] = {start_node: None}
-        cost_so_far: dict[IntVector2, float] = {start_node: 0}
-        frontier: _PriorityQueue = _PriorityQueue()
-        frontier.put(0, start_node)
-
-        while not frontier.is_empty:
-            current_node = frontier.get()
-
-            if current_node == goal_node:  # early exit
+    def _a_star_heuristic(self, goal_node: IntVector2) -> Callable[[int], float]:
+        """Return lower bound of cost from node index to `goal_node`.
+
+        Octile distance, or the landmark lower bound if greater.
+        """
+        width = self.size.x
+        goal = goal_node.y * width + goal_node.x
+        landmark_bound = (
+            self.landmarks.heuristic(goal) if self.landmarks is not None else None
+        )
+
+        def heuristic(index: int) -> float:
+            y, x = divmod(index, width)
+            bound = octile_length(x - goal_node.x, y - goal_node.y)
+            if landmark_bound is not None:
+                return max(bound, landmark_bound(index))
+
+            return bound
+
+        return heuristic
+
+    def _average_potential(
+        self, start_node: IntVector2, goal_node: IntVector2
+    ) -> Callable[[int], float]:
+        """Return forward potential of node index, for bidirectional A* search.
+
+        Half the difference of the A* heuristics toward `goal_node` and toward
+        `start_node`; the backward potential is its negation. Both are
+        consistent, so the searches can stop as bidirectional uniform cost
+        search does.
+        """
+        to_goal = self._a_star_heuristic(goal_node)
+        to_start = self._a_star_heuristic(start_node)
+
+        def potential(index: int) -> float:
+            return (to_goal(index) - to_start(index)) / 2
+
+        return potential
+
+    def _distances_from(self, source: int) -> array[float]:
+        """Return least cost from node index `source` to each node, by index.
+
+        `math.inf` where unreachable.
+        """
+        distances = array("d", [math.inf]) * (self.size.x * self.size.y)
+        distances[source] = 0
+        frontier: list[tuple[float, int]] = [(0, source)]
+        while frontier:
+            cost, current = heapq.heappop(frontier)
+            if cost > distances[current]:  # stale entry
+                continue
+
+            for new, step_cost in self._index_neighbors(current):
+                new_cost = cost + step_cost
+                if new_cost < distances[new]:
+                    distances[new] = new_cost
+                    heapq.heappush(frontier, (new_cost, new))
+
+        return distances
+
+    def preprocess_landmarks(self, count: int = 8) -> Landmarks:
+        """Select `count` landmarks, and compute distances from them.
+
+        Landmarks are spread out by farthest-point selection.
+        Result is stored as `landmarks`, and returned.
+
+        Remain valid as nodes are blocked; cleared when a node is unblocked.
+        """
+        cell_count = self.size.x * self.size.y
+        open_indices = [i for i in range(cell_count) if i not in self._blocked_indices]
+        if count < 1 or not open_indices:
+            err_msg = (
+                f"Expected >= 1 landmarks and open nodes; "
+                f"got {count} and {len(open_indices)}"
+            )
+            raise ValueError(err_msg)
+
+        # Start from the node farthest from an arbitrary node...
+        distances = self._distances_from(open_indices[0])
+        nearest_landmark = array("d", [math.inf]) * cell_count
+        landmark_indices: list[int] = []
+        all_distances: list[array[float]] = []
+        for _ in range(count):
+            landmark = max(
+                open_indices,
+                key=lambda i: (
+                    nearest_landmark[i] if distances[i] < math.inf else -1,
+                    distances[i] if distances[i] < math.inf else -1,
+                ),
+            )
+            if landmark in landmark_indices:
                 break
 
-            for new_node in self._reachable_neighbors(current_node):
-                new_cost = cost_so_far[current_node] + self.cost(current_node, new_node)
-                if (
-                    new_node not in came_from or new_cost < cost_so_far[new_node]
-                    # add new_node to frontier if cheaper
-                ):
-                    cost_so_far[new_node] = new_cost
-                    frontier.put(priority=new_cost, node=new_node)
-                    came_from[new_node] = current_node
+            distances = self._distances_from(landmark)
+            landmark_indices.append(landmark)
+            all_distances.append(distances)
+            for i in open_indices:
+                nearest_landmark[i] = min(nearest_landmark[i], distances[i])
+
+        self.landmarks = Landmarks(
+            size=self.size,
+            nodes=tuple(self._node_at(i) for i in landmark_indices),
+            distances=tuple(all_distances),
+            checksum=map_checksum(self.size, self.blocked_nodes),
+        )
+        return self.landmarks
+
+    def load_landmarks(self, path: Path) -> Landmarks:
+        """Load landmarks saved with `Landmarks.save` as `landmarks`, and return.
+
+        Raises `ValueError` if they were preprocessed for a different map.
+        """
+        landmarks = Landmarks.load(path)
+        if landmarks.checksum != map_checksum(self.size, self.blocked_nodes):
+            err_msg = f"Landmarks in {path} were preprocessed for a different map"
+            raise ValueError(err_msg)
+
+        self.landmarks = landmarks
+        return landmarks
+
+    def _start_search(
+        self,
+        from_node: IntVector2,
+        to_node: IntVector2,
+        algorithm: str,
+        on_expand: Callable[[IntVector2], None] | None,
+        *,
+        instrumented: bool,
+    ) -> _Search | _BidirectionalSearch:
+        """Return a new search for `algorithm`; see `route`."""
+        width = self.size.x
+        start = from_node.y * width + from_node.x
+        goal = to_node.y * width + to_node.x
+        if algorithm in _BIDIRECTIONAL_ALGORITHMS:
+            return _BidirectionalSearch(
+                index_neighbors=self._index_neighbors,
+                node_at=self._node_at,
+                width=width,
+                start=start,
+                goal=goal,
+                potential=(
+                    self._average_potential(from_node, to_node)
+                    if algorithm == "BIDIRECTIONAL_A_STAR"
+                    else None
+                ),
+                on_expand=on_expand,
+                instrumented=instrumented,
+            )
 
-        return came_from
+        return _Search(
+            index_neighbors=self._index_neighbors,
+            node_at=self._node_at,
+            width=width,
+            start=start,
+            goal=goal,
+            heuristic=(
+                self._a_star_heuristic(to_node) if algorithm == "A_STAR" else None
+            ),
+            on_expand=on_expand,
+            instrumented=instrumented,
+        )
+
+    def _path(self, came_from: dict[int, int], target: int) -> list[IntVector2]:
+        """Return path to node index `target`, retracing `came_from` to start."""
+        path_from_target = []
+        current = target
+        while current != -1:
+            path_from_target.append(self._node_at(current))
+            current = came_from[current]
+
+        return list(reversed(path_from_target))
+
+    def _is_routable(self, from_node: IntVector2, to_node: IntVector2) -> bool:
+        """Return whether a route might exist, without searching."""
+        return (
+            self.is_in_bounds(from_node)
+            and self.is_in_bounds(to_node)
+            and (to_node not in self.blocked_nodes or to_node == from_node)
+        )
+
+    def start_route(
+        self,
+        from_node: IntVector2,
+        to_node: IntVector2,
+        algorithm: str = "UNIFORM_COST_SEARCH",
+    ) -> RouteSearch:
+        """Return a `RouteSearch` from `from_node` to `to_node`, to be stepped.
+
+        Once done, its `result` is the same as `route` would return.
 
-    def route(
+        `algorithm`: see `route`.
+
+        The grid's blocked nodes shouldn't change during the search.
+        """
+        if algorithm not in _ALGORITHMS:
+            err_msg = f"Algorithm {algorithm} not implemented."
+            raise NotImplementedError(err_msg)
+
+        search = (
+            self._start_search(from_node, to_node, algorithm, None, instrumented=False)
+            if self._is_routable(from_node, to_node)
+            else None
+        )
+        return RouteSearch(from_node, to_node, search, self._path)
+
+    def route(  # noqa: PLR0913
         self,
         from_node: IntVector2,
         to_node: IntVector2,
         algorithm: str = "UNIFORM_COST_SEARCH",
+        *,
+        stats: SearchStats | None = None,
+        on_expand: Callable[[IntVector2], None] | None = None,
+        should_stop: Callable[[], bool] | None = None,
     ) -> list[IntVector2] | None:
         """Return a node-based route from `from_node` to `to_node`.
 
+        Parameters:
+        -----------
+        `algorithm`:
+            `"UNIFORM_COST_SEARCH"`;
+            `"A_STAR"`: guided toward `to_node` by a heuristic, which uses
+            `landmarks` if available;
+            `"BIDIRECTIONAL_UNIFORM_COST_SEARCH"`: searches from both ends,
+            exploring about half the area for long routes;
+            `"BIDIRECTIONAL_A_STAR"`: searches from both ends, each guided by
+            the A* heuristics toward both ends.
+            All return a route of least cost.
+
+        `stats`: if provided, populated with counters from the search.
+
+        `on_expand`: if provided, called with each node as it's expanded.
+
+        `should_stop`: if provided, called periodically during search; if it
+        returns `True`, the search stops early, with a best-effort route.
+
         Returns:
         --------
         `list[IntVector2]`:
             Nodes on the route `to_node`.
-            Includes `to_node`; doesn't include `from_node`.
+            Includes `from_node` and `to_node`.
+            If stopped early, the route ends at the node nearest `to_node` found
+            so far instead.
 
         `None`:
             if no route was found.
 
         """
-        if algorithm != "UNIFORM_COST_SEARCH":
+        if algorithm not in _ALGORITHMS:
             err_msg = f"Algorithm {algorithm} not implemented."
             raise NotImplementedError(err_msg)
 
-        came_from = self._search(from_node, to_node)
-
-        # Construct node path starting at `to_node` and retracing toward `from_node`...
-        path_from_goal = [to_node]
-        current_node = to_node
+        if not self._is_routable(from_node, to_node):
+            return None
+
+        goal = to_node.y * self.size.x + to_node.x
+        start_time = time.perf_counter() if stats is not None else 0
+        search = self._start_search(
+            from_node,
+            to_node,
+            algorithm,
+            on_expand,
+            instrumented=stats is not None or on_expand is not None,
+        )
+        if should_stop is None:
+            search.step()
+        else:
+            while not search.step(_STOP_CHECK_INTERVAL) and not should_stop():
+                pass
+
+        if stats is not None:
+            stats.record(
+                nodes_expanded=search.nodes_expanded,
+                nodes_pushed=search.nodes_pushed,
+                peak_frontier=search.peak_frontier,
+                start_time=start_time,
+                early_exit=search.found,
+            )
 
-        while current_node != from_node:
-            came_from_node = came_from.get(current_node)
-            if came_from_node is None:
-                return None
+        if search.found:
+            return self._path(search.came_from, goal)
 
-            current_node = came_from_node
-            path_from_goal.append(current_node)
+        if not search.is_done:  # stopped early
+            return self._path(search.came_from, search.closest())
 
-        return list(reversed(path_from_goal))
+        return None
@@ -0,0 +1,192 @@
+"""Contains `RouteService` class: `asyncio` front-end to `NavigationGrid.route`."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Self
+
+    from flatlandian.int_vector2 import IntVector2
+    from flatlandian.navigation_grid import NavigationGrid, RouteSearch
+
+_STEP_BUDGET = 64
+"""Nodes expanded by a worker between checks for cancellation."""
+
+
+@dataclass(frozen=True, kw_only=True)
+class RouteServiceMetrics:
+    """Snapshot of `RouteService` load."""
+
+    queue_depth: int
+    """Searches waiting for a worker."""
+    in_flight: int
+    """Searches queued or running."""
+    requests: int
+    """Total requests received."""
+    coalesced: int
+    """Total requests that joined an identical in-flight search."""
+    stopped_early: int
+    """Total requests answered with a best-effort route at their time limit."""
+
+
+@dataclass(kw_only=True)
+class _Job:
+    """A search shared by one or more coalesced requests."""
+
+    search: RouteSearch
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    """Held by the worker while stepping `search`."""
+    waiters: int = 1
+    cancelled: bool = False
+    closed: bool = False
+    """Whether cancelled by `RouteService.close`."""
+    started: bool = False
+    future: asyncio.Future[list[IntVector2] | None] = field(init=False)
+
+    def run(self) -> list[IntVector2] | None:
+        """Run search in a worker thread, until done or cancelled."""
+        self.started = True
+        while not self.cancelled:
+            with self.lock:
+                if self.search.step(_STEP_BUDGET):
+                    break
+
+        return self.search.result
+
+    def best_effort(self) -> list[IntVector2] | None:
+        """Return best-effort route from the search so far."""
+        with self.lock:
+            return self.search.best_effort()
+
+
+@dataclass
+class RouteService:
+    """Runs `NavigationGrid` route searches in worker threads, for `asyncio`.
+
+    Identical concurrent requests share a single search.
+
+    Close with `close`, or use as an async context manager.
+    """
+
+    grid: NavigationGrid
+    algorithm: str = "A_STAR"
+    """Any `NavigationGrid.route` algorithm."""
+    max_workers: int = 1
+    _executor: ThreadPoolExecutor = field(init=False, repr=False)
+    _jobs: dict[tuple[IntVector2, IntVector2], _Job] = field(
+        init=False, default_factory=dict, repr=False
+    )
+    _closed: bool = field(init=False, default=False, repr=False)
+    _requests: int = field(init=False, default=0)
+    _coalesced: int = field(init=False, default=0)
+    _stopped_early: int = field(init=False, default=0)
+
+    def __post_init__(self) -> None:
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="flatlandian-route"
+        )
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop all searches, and shut down workers.
+
+        Pending requests raise `RuntimeError`.
+        """
+        self._closed = True
+        for job in self._jobs.values():
+            job.cancelled = job.closed = True
+
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    @property
+    def metrics(self) -> RouteServiceMetrics:
+        """Return snapshot of load."""
+        return RouteServiceMetrics(
+            queue_depth=sum(not job.started for job in self._jobs.values()),
+            in_flight=len(self._jobs),
+            requests=self._requests,
+            coalesced=self._coalesced,
+            stopped_early=self._stopped_early,
+        )
+
+    def _forget(self, key: tuple[IntVector2, IntVector2], job: _Job) -> None:
+        """Stop new requests for `key` joining `job`."""
+        if self._jobs.get(key) is job:
+            del self._jobs[key]
+
+    def _leave(self, key: tuple[IntVector2, IntVector2], job: _Job) -> None:
+        """Remove a waiter from `job`; stop it if none remain."""
+        job.waiters -= 1
+        if not job.waiters:
+            job.cancelled = True
+            self._forget(key, job)
+
+    def _join(self, from_node: IntVector2, to_node: IntVector2) -> _Job:
+        """Return a new or in-flight job for the route."""
+        key = (from_node, to_node)
+        job = self._jobs.get(key)
+        if job is not None:
+            self._coalesced += 1
+            job.waiters += 1
+            return job
+
+        job = _Job(search=self.grid.start_route(from_node, to_node, self.algorithm))
+        self._jobs[key] = job
+        job.future = asyncio.get_running_loop().run_in_executor(self._executor, job.run)
+        job.future.add_done_callback(lambda _: self._forget(key, job))
+        return job
+
+    async def route(
+        self,
+        from_node: IntVector2,
+        to_node: IntVector2,
+        *,
+        time_limit: float | None = None,
+    ) -> list[IntVector2] | None:
+        """Return a node-based route from `from_node` to `to_node`.
+
+        See `NavigationGrid.route`.
+
+        `time_limit`: seconds after which this request is answered with a
+        best-effort route, ending at the node nearest `to_node` found so far.
+        Coalesced requests share a search, which continues for the others.
+
+        If all requests for a search are cancelled or time out, the search stops.
+        Raises `RuntimeError` if the service is closed.
+        """
+        if self._closed:
+            err_msg = "RouteService is closed"
+            raise RuntimeError(err_msg)
+
+        self._requests += 1
+        key = (from_node, to_node)
+        job = self._join(from_node, to_node)
+        try:
+            route = await asyncio.wait_for(asyncio.shield(job.future), time_limit)
+        except TimeoutError:
+            self._leave(key, job)
+            self._stopped_early += 1
+            return await asyncio.to_thread(job.best_effort)
+        except asyncio.CancelledError:
+            if job.closed:  # not cancelled by the caller
+                err_msg = "RouteService was closed"
+                raise RuntimeError(err_msg) from None
+
+            self._leave(key, job)
+            raise
+
+        if job.closed:
+            err_msg = "RouteService was closed"
+            raise RuntimeError(err_msg)
+
+        return route
@@ -0,0 +1,151 @@
+"""Contains `SpatialHash` class."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from pygame.math import Vector2
+
+_FORWARD_OFFSETS = [(1, -1), (1, 0), (1, 1), (0, 1)]
+"""Half of the neighboring bucket offsets: each bucket pair is visited once."""
+
+
+@dataclass
+class SpatialHash:
+    """Uniform grid of buckets holding indexed points, for neighbor queries.
+
+    Points are identified by `int` index, e.g. position in a list of entities.
+    """
+
+    cell_size: float
+    buckets: dict[tuple[int, int], list[int]] = field(
+        init=False, default_factory=dict, repr=False
+    )
+    xs: list[float] = field(init=False, default_factory=list, repr=False)
+    """x coordinate of each point, by index."""
+    ys: list[float] = field(init=False, default_factory=list, repr=False)
+    """y coordinate of each point, by index."""
+
+    def __post_init__(self) -> None:
+        if not self.cell_size > 0:
+            err_msg = f"Expected positive `cell_size`, got {self.cell_size}"
+            raise ValueError(err_msg)
+
+    @classmethod
+    def from_positions(
+        cls, positions: Iterable[Vector2], cell_size: float
+    ) -> SpatialHash:
+        """Construct `SpatialHash` holding `positions`, indexed in iteration order."""
+        xs, ys = [], []
+        for position in positions:
+            xs.append(position.x)
+            ys.append(position.y)
+
+        return cls.from_coordinates(xs, ys, cell_size)
+
+    @classmethod
+    def from_coordinates(
+        cls, xs: list[float], ys: list[float], cell_size: float
+    ) -> SpatialHash:
+        """Construct `SpatialHash` holding points (`xs[i]`, `ys[i]`), indexed by `i`.
+
+        Faster than `insert` for each point. Takes ownership of `xs` and `ys`.
+        """
+        spatial_hash = cls(cell_size)
+        spatial_hash.xs, spatial_hash.ys = xs, ys
+        buckets = spatial_hash.buckets
+        floor = math.floor
+        for i, (x, y) in enumerate(zip(xs, ys, strict=True)):
+            key = floor(x / cell_size), floor(y / cell_size)
+            bucket = buckets.get(key)
+            if bucket is None:
+                buckets[key] = [i]
+            else:
+                bucket.append(i)
+
+        return spatial_hash
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    def bucket_key(self, x: float, y: float) -> tuple[int, int]:
+        """Return the key of the bucket containing point (`x`, `y`)."""
+        return math.floor(x / self.cell_size), math.floor(y / self.cell_size)
+
+    def insert(self, x: float, y: float) -> int:
+        """Add point (`x`, `y`). Return its index."""
+        index = len(self.xs)
+        self.xs.append(x)
+        self.ys.append(y)
+        self.buckets.setdefault(self.bucket_key(x, y), []).append(index)
+        return index
+
+    def candidate_pairs(self) -> Iterator[tuple[int, int]]:
+        """Yield each pair of points in the same or adjacent buckets, once.
+
+        Includes every pair closer than `cell_size`, plus some further apart.
+        """
+        buckets = self.buckets
+        for (bx, by), indices in buckets.items():
+            for n, i in enumerate(indices):
+                for j in indices[n + 1 :]:
+                    yield i, j
+
+            for dx, dy in _FORWARD_OFFSETS:
+                others = buckets.get((bx + dx, by + dy))
+                if others:
+                    for i in indices:
+                        for j in others:
+                            yield i, j
+
+    def query(self, x: float, y: float, radius: float) -> Iterator[int]:
+        """Yield the index of each point within `radius` of (`x`, `y`)."""
+        xs, ys = self.xs, self.ys
+        radius_squared = radius * radius
+        min_bx, min_by = self.bucket_key(x - radius, y - radius)
+        max_bx, max_by = self.bucket_key(x + radius, y + radius)
+        for bx in range(min_bx, max_bx + 1):
+            for by in range(min_by, max_by + 1):
+                for i in self.buckets.get((bx, by), ()):
+                    dx = xs[i] - x
+                    dy = ys[i] - y
+                    if dx * dx + dy * dy <= radius_squared:
+                        yield i
+
+    def neighbor_lists(self) -> list[list[int]]:
+        """Return, for each point, the indices of other points within `cell_size`.
+
+        Faster than `query` for every point: each pair of points in the same or
+        adjacent buckets is checked once.
+        """
+        xs, ys = self.xs, self.ys
+        get_bucket = self.buckets.get
+        radius_squared = self.cell_size * self.cell_size
+        neighbors: list[list[int]] = [[] for _ in xs]
+        for (bx, by), indices in self.buckets.items():
+            for n, i in enumerate(indices):
+                x, y = xs[i], ys[i]
+                for j in indices[n + 1 :]:
+                    dx, dy = xs[j] - x, ys[j] - y
+                    if dx * dx + dy * dy <= radius_squared:
+                        neighbors[i].append(j)
+                        neighbors[j].append(i)
+
+            for offset_x, offset_y in _FORWARD_OFFSETS:
+                others = get_bucket((bx + offset_x, by + offset_y))
+                if others:
+                    for i in indices:
+                        x, y = xs[i], ys[i]
+                        point_neighbors = neighbors[i]
+                        for j in others:
+                            dx, dy = xs[j] - x, ys[j] - y
+                            if dx * dx + dy * dy <= radius_squared:
+                                point_neighbors.append(j)
+                                neighbors[j].append(i)
+
+        return neighbors
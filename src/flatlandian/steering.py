@@ -0,0 +1,217 @@
+"""Contains `Steering` class: steering behaviors for many entities at once."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from pygame.math import Vector2
+
+from flatlandian.spatial_hash import SpatialHash
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from flatlandian.entity import Entity
+
+
+def limit_speed(entities: Iterable[Entity], max_speed: float) -> None:
+    """Scale down the velocity of any of `entities` faster than `max_speed`."""
+    max_speed_squared = max_speed * max_speed
+    for entity in entities:
+        if entity.velocity.magnitude_squared() > max_speed_squared:
+            entity.velocity = entity.velocity * (max_speed / entity.velocity.length())
+
+
+@dataclass
+class Steering:
+    """Accumulates weighted steering forces for `entities`, then applies them.
+
+    Each behavior computes, per entity, a desired velocity at up to `max_speed`,
+    and adds the difference from current velocity, times its weight, to the
+    entity's steering force. `apply` then sets each entity's acceleration to its
+    steering force, clamped to `max_force`.
+
+    Positions and velocities are read once, on construction, so construct each
+    frame. Flocking behaviors find neighbors with a `SpatialHash`, shared by
+    behaviors with the same radius.
+    """
+
+    entities: Sequence[Entity]
+    max_speed: float
+    max_force: float
+    xs: list[float] = field(init=False, repr=False)
+    ys: list[float] = field(init=False, repr=False)
+    vxs: list[float] = field(init=False, repr=False)
+    vys: list[float] = field(init=False, repr=False)
+    force_xs: list[float] = field(init=False, repr=False)
+    """Steering force x component, by entity index."""
+    force_ys: list[float] = field(init=False, repr=False)
+    """Steering force y component, by entity index."""
+    _neighbors: dict[float, list[list[int]]] = field(
+        init=False, default_factory=dict, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        n = len(self.entities)
+        self.xs = [entity.position.x for entity in self.entities]
+        self.ys = [entity.position.y for entity in self.entities]
+        self.vxs = [entity.velocity.x for entity in self.entities]
+        self.vys = [entity.velocity.y for entity in self.entities]
+        self.force_xs = [0.0] * n
+        self.force_ys = [0.0] * n
+
+    def _steer(
+        self,
+        dxs: Sequence[float],
+        dys: Sequence[float],
+        speeds: Sequence[float],
+        weight: float,
+    ) -> None:
+        """Add force toward velocity of `speeds[i]` in direction (`dxs[i]`, `dys[i]`).
+
+        For each entity `i`; none if its direction is (0, 0).
+        """
+        force_xs, force_ys = self.force_xs, self.force_ys
+        for i, (dx, dy, speed, vx, vy) in enumerate(
+            zip(dxs, dys, speeds, self.vxs, self.vys, strict=True)
+        ):
+            length = math.hypot(dx, dy)
+            if length > 0:
+                scale = speed / length
+                force_xs[i] += weight * (dx * scale - vx)
+                force_ys[i] += weight * (dy * scale - vy)
+
+    def _check_per_entity(self, values: Sequence[Vector2], name: str) -> None:
+        """Raise `ValueError` unless there's one of `values` for each entity."""
+        if len(values) != len(self.entities):
+            err_msg = (
+                f"Expected {len(self.entities)} {name}, one per entity; "
+                f"got {len(values)}"
+            )
+            raise ValueError(err_msg)
+
+    def neighbors(self, radius: float) -> list[list[int]]:
+        """Return, for each entity, the indices of other entities within `radius`."""
+        if radius not in self._neighbors:
+            spatial_hash = SpatialHash.from_coordinates(
+                list(self.xs), list(self.ys), radius
+            )
+            self._neighbors[radius] = spatial_hash.neighbor_lists()
+
+        return self._neighbors[radius]
+
+    def seek(self, targets: Sequence[Vector2], weight: float = 1) -> None:
+        """Steer each entity toward its target at full speed.
+
+        Raises `ValueError` unless there's a target for each entity.
+        """
+        self._check_per_entity(targets, "targets")
+        self._steer(
+            [target.x - x for target, x in zip(targets, self.xs, strict=True)],
+            [target.y - y for target, y in zip(targets, self.ys, strict=True)],
+            [self.max_speed] * len(targets),
+            weight,
+        )
+
+    def flee(self, threats: Sequence[Vector2], weight: float = 1) -> None:
+        """Steer each entity away from its threat at full speed.
+
+        Raises `ValueError` unless there's a threat for each entity.
+        """
+        self._check_per_entity(threats, "threats")
+        self._steer(
+            [x - threat.x for threat, x in zip(threats, self.xs, strict=True)],
+            [y - threat.y for threat, y in zip(threats, self.ys, strict=True)],
+            [self.max_speed] * len(threats),
+            weight,
+        )
+
+    def arrive(
+        self, targets: Sequence[Vector2], slowing_radius: float, weight: float = 1
+    ) -> None:
+        """Steer each entity toward its target, slowing to stop on it.
+
+        Speed falls linearly to 0 within `slowing_radius` of the target.
+        Raises `ValueError` unless there's a target for each entity.
+        """
+        self._check_per_entity(targets, "targets")
+        dxs = [target.x - x for target, x in zip(targets, self.xs, strict=True)]
+        dys = [target.y - y for target, y in zip(targets, self.ys, strict=True)]
+        speeds = []
+        max_speed = self.max_speed
+        for i, (dx, dy) in enumerate(zip(dxs, dys, strict=True)):
+            distance = math.hypot(dx, dy)
+            speeds.append(max_speed * min(1, distance / slowing_radius))
+            if distance == 0:
+                self.force_xs[i] -= weight * self.vxs[i]
+                self.force_ys[i] -= weight * self.vys[i]
+
+        self._steer(dxs, dys, speeds, weight)
+
+    def separation(self, radius: float, weight: float = 1) -> None:
+        """Steer each entity away from neighbors within `radius`.
+
+        Nearer neighbors repel more, by inverse distance.
+        """
+        xs, ys = self.xs, self.ys
+        away_xs, away_ys = [], []
+        for i, neighbors in enumerate(self.neighbors(radius)):
+            x, y = xs[i], ys[i]
+            away_x = away_y = 0.0
+            for j in neighbors:
+                dx, dy = x - xs[j], y - ys[j]
+                distance_squared = dx * dx + dy * dy
+                if distance_squared > 0:
+                    away_x += dx / distance_squared
+                    away_y += dy / distance_squared
+
+            away_xs.append(away_x)
+            away_ys.append(away_y)
+
+        self._steer(away_xs, away_ys, [self.max_speed] * len(xs), weight)
+
+    def alignment(self, radius: float, weight: float = 1) -> None:
+        """Steer each entity toward the mean heading of neighbors within `radius`."""
+        vxs, vys = self.vxs, self.vys
+        heading_xs, heading_ys = [], []
+        for neighbors in self.neighbors(radius):
+            heading_x = heading_y = 0.0
+            for j in neighbors:
+                heading_x += vxs[j]
+                heading_y += vys[j]
+
+            heading_xs.append(heading_x)
+            heading_ys.append(heading_y)
+
+        self._steer(heading_xs, heading_ys, [self.max_speed] * len(vxs), weight)
+
+    def cohesion(self, radius: float, weight: float = 1) -> None:
+        """Steer each entity toward the center of neighbors within `radius`."""
+        xs, ys = self.xs, self.ys
+        to_center_xs, to_center_ys = [], []
+        for i, neighbors in enumerate(self.neighbors(radius)):
+            sum_x = sum_y = 0.0
+            for j in neighbors:
+                sum_x += xs[j]
+                sum_y += ys[j]
+
+            n = len(neighbors)
+            to_center_xs.append(sum_x / n - xs[i] if n else 0)
+            to_center_ys.append(sum_y / n - ys[i] if n else 0)
+
+        self._steer(to_center_xs, to_center_ys, [self.max_speed] * len(xs), weight)
+
+    def apply(self) -> None:
+        """Set each entity's acceleration to its steering force, up to `max_force`.
+
+        To also limit speed after moving, see `limit_speed`.
+        """
+        max_force = self.max_force
+        for entity, force_x, force_y in zip(
+            self.entities, self.force_xs, self.force_ys, strict=True
+        ):
+            magnitude = math.hypot(force_x, force_y)
+            scale = max_force / magnitude if magnitude > max_force else 1
+            entity.acceleration = Vector2(force_x * scale, force_y * scale)
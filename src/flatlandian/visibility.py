@@ -0,0 +1,190 @@
+"""Contains line of sight and field of view functions, and `FieldOfView` class."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from flatlandian.int_vector2 import IntVector2
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+_OCTANTS = [
+    (1, 0, 0, 1),
+    (0, 1, 1, 0),
+    (0, -1, 1, 0),
+    (-1, 0, 0, 1),
+    (-1, 0, 0, -1),
+    (0, -1, -1, 0),
+    (0, 1, -1, 0),
+    (1, 0, 0, -1),
+]
+"""`(xx, xy, yx, yy)` transforms from octant-relative to grid offsets."""
+
+
+@dataclass(frozen=True)
+class FieldOfView:
+    """Cells visible from `origin`, within `radius`.
+
+    Stored as a mask of the square of side `2 * radius + 1` centered on `origin`.
+    Supports `in` and iteration over visible cells.
+    """
+
+    origin: IntVector2
+    radius: int
+    mask: bytes
+    """Row-major; nonzero where visible."""
+
+    def __contains__(self, cell: object) -> bool:
+        if not isinstance(cell, IntVector2):
+            return False
+
+        side = 2 * self.radius + 1
+        dx = cell.x - self.origin.x + self.radius
+        dy = cell.y - self.origin.y + self.radius
+        return 0 <= dx < side and 0 <= dy < side and bool(self.mask[dy * side + dx])
+
+    def __iter__(self) -> Iterator[IntVector2]:
+        side = 2 * self.radius + 1
+        min_x = self.origin.x - self.radius
+        min_y = self.origin.y - self.radius
+        for i, visible in enumerate(self.mask):
+            if visible:
+                dy, dx = divmod(i, side)
+                yield IntVector2(min_x + dx, min_y + dy)
+
+    def __len__(self) -> int:
+        return len(self.mask) - self.mask.count(0)
+
+
+def has_line_of_sight(
+    cell1: IntVector2, cell2: IntVector2, is_opaque: Callable[[int, int], bool]
+) -> bool:
+    """Return whether no opaque cell lies between the cells' centers.
+
+    Checks every cell the line passes through (supercover), excluding the ends.
+    Where the line passes exactly through a corner, the view is blocked only if
+    both cells beside the corner are opaque.
+    """
+    x, y = cell1.x, cell1.y
+    nx, ny = abs(cell2.x - x), abs(cell2.y - y)
+    sx = 1 if cell2.x > x else -1
+    sy = 1 if cell2.y > y else -1
+    ix = iy = 0
+    while ix < nx or iy < ny:
+        # Compare where the line next crosses a vertical vs horizontal cell edge...
+        decision = (1 + 2 * ix) * ny - (1 + 2 * iy) * nx
+        if decision == 0:
+            if is_opaque(x + sx, y) and is_opaque(x, y + sy):
+                return False
+
+            x, y, ix, iy = x + sx, y + sy, ix + 1, iy + 1
+        elif decision < 0:
+            x, ix = x + sx, ix + 1
+        else:
+            y, iy = y + sy, iy + 1
+
+        if (ix < nx or iy < ny) and is_opaque(x, y):
+            return False
+
+    return True
+
+
+@dataclass
+class _Shadowcaster:
+    """Marks cells visible from `origin` in `mask`, one octant at a time."""
+
+    origin: IntVector2
+    radius: int
+    is_opaque: Callable[[int, int], bool]
+    mask: bytearray
+
+    def cast_light(
+        self,
+        row: int,
+        start_slope: float,
+        end_slope: float,
+        transform: tuple[int, int, int, int],
+    ) -> None:
+        """Mark visible cells in one octant, from `row` outward."""
+        xx, xy, yx, yy = transform
+        radius = self.radius
+        side = 2 * radius + 1
+        next_start_slope = start_slope
+        for distance in range(row, radius + 1):
+            blocked = False
+            dy = -distance
+            for dx in range(-distance, 1):
+                left_slope = (dx - 0.5) / (dy + 0.5)
+                right_slope = (dx + 0.5) / (dy - 0.5)
+                if start_slope < right_slope:
+                    continue
+
+                if end_slope > left_slope:
+                    break
+
+                offset_x = dx * xx + dy * xy
+                offset_y = dx * yx + dy * yy
+                if dx * dx + dy * dy < radius * radius:
+                    self.mask[(offset_y + radius) * side + offset_x + radius] = 1
+
+                opaque = self.is_opaque(
+                    self.origin.x + offset_x, self.origin.y + offset_y
+                )
+                if blocked:
+                    if opaque:
+                        next_start_slope = right_slope
+                    else:
+                        blocked = False
+                        start_slope = next_start_slope
+                elif opaque and distance < radius:
+                    blocked = True
+                    self.cast_light(distance + 1, start_slope, left_slope, transform)
+                    next_start_slope = right_slope
+
+            if blocked:
+                break
+
+
+def _clip_to_grid(
+    mask: bytearray, origin: IntVector2, radius: int, size: IntVector2
+) -> None:
+    """Clear `mask` entries outside a grid of `size`."""
+    side = 2 * radius + 1
+    min_x, min_y = origin.x - radius, origin.y - radius
+    for row in range(side):
+        if not 0 <= min_y + row < size.y:
+            mask[row * side : (row + 1) * side] = bytes(side)
+            continue
+
+        for column in range(side):
+            if not 0 <= min_x + column < size.x:
+                mask[row * side + column] = 0
+
+
+def field_of_view(
+    origin: IntVector2,
+    radius: int,
+    is_opaque: Callable[[int, int], bool],
+    *,
+    size: IntVector2 | None = None,
+) -> FieldOfView:
+    """Return cells visible from `origin` by recursive shadowcasting.
+
+    Bounded by the same circle as `geometry.cells_in_circle`. Opaque cells are
+    visible themselves, but hide the cells behind them.
+
+    `size`: if provided, cells outside a grid of this size aren't visible.
+    """
+    side = 2 * radius + 1
+    mask = bytearray(side * side)
+    mask[radius * side + radius] = 1
+    shadowcaster = _Shadowcaster(origin, radius, is_opaque, mask)
+    for transform in _OCTANTS:
+        shadowcaster.cast_light(1, 1.0, 0.0, transform)
+
+    if size is not None:
+        _clip_to_grid(mask, origin, radius, size)
+
+    return FieldOfView(origin, radius, bytes(mask))
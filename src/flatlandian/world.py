@@ -3,13 +3,19 @@
 from __future__ import annotations
 
 import random
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import InitVar, dataclass, field
 from typing import TYPE_CHECKING
 
 from pygame.math import Vector2
 
+from flatlandian.collision import contain, find_contacts, resolve_contacts
+
+_SHARDINGS = {"ROUND_ROBIN", "REGION"}
+
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Sequence
 
     from flatlandian.entity import Entity
 
@@ -23,10 +29,47 @@ class World:
     centered_origin: bool = False
     step_counter: int = field(init=False, default=0)
     entities: set[Entity] = field(init=False, default_factory=set)
+    detect_collisions: bool = field(default=False, repr=False)
+    """Find overlapping entities on `update`, storing them in `contacts`."""
+    resolve_collisions: bool = field(default=False, repr=False)
+    """Separate overlapping entities and bounce them apart on `update`.
+
+    Requires `detect_collisions`.
+    """
+    contain_entities: bool = field(default=False, repr=False)
+    """Keep entities within the world on `update`, bouncing them off edges."""
+    restitution: float = field(default=1, repr=False)
+    """Bounciness of collisions: 1 for perfectly elastic, 0 for inelastic."""
+    contacts: tuple[array[int], array[int]] = field(
+        init=False, default_factory=lambda: (array("l"), array("l")), repr=False
+    )
+    """Index pairs into `contact_entities` of overlapping entities, found on the
+    last `update`; see `collision.find_contacts`."""
+    contact_entities: list[Entity] = field(init=False, default_factory=list, repr=False)
+    """Entities, in the order indexed by `contacts`."""
+    threads: int = field(default=1, repr=False)
+    """Threads to update entities on, in shards; parallel on free-threaded Python.
+
+    Entities' `update` must then only change the entity itself. See `close`.
+    """
+    sharding: str = field(default="ROUND_ROBIN", repr=False)
+    """How entities are divided between `threads`.
+
+    `"ROUND_ROBIN"`: evenly, in arbitrary order;
+    `"REGION"`: into vertical strips of the world, by x coordinate.
+    """
+    _executor: ThreadPoolExecutor | None = field(init=False, default=None, repr=False)
 
     def __post_init__(self, size_from_sequence: Sequence[float]) -> None:
         """Initialize a `World`."""
         self.size = Vector2(size_from_sequence)
+        if self.threads < 1:
+            err_msg = f"Expected at least 1 thread, got {self.threads}"
+            raise ValueError(err_msg)
+
+        if self.sharding not in _SHARDINGS:
+            err_msg = f"Sharding {self.sharding} not implemented."
+            raise NotImplementedError(err_msg)
 
     @property
     def origin_offset(self) -> Vector2:
@@ -46,49 +89,163 @@ class World:
             ")"
         )
 
+    def _bounds(self, offset: float = 0) -> tuple[Vector2, Vector2]:
+        """Return minimum and maximum corners, offset in/out from edge."""
+        min_ = Vector2(0, 0) - self.origin_offset - Vector2(offset, offset)
+        max_ = self.size - self.origin_offset + Vector2(offset, offset)
+        return min_, max_
+
     def position_is_in_bounds(self, position: Vector2, *, offset: float = 0) -> bool:
         """Return whether `position` is within the world.
 
         -ve/+ve offset: offset in/out from edge.
         """
-        min_ = Vector2(0, 0) - self.origin_offset - Vector2(offset, offset)
-        max_ = self.size - self.origin_offset + Vector2(offset, offset)
+        min_, max_ = self._bounds(offset)
         return min_.x <= position.x <= max_.x and min_.y <= position.y <= max_.y
 
-    def random_position(self) -> Vector2:
-        """Return a uniformly distributed random position within the world."""
-        return Vector2(
-            random.uniform(0, self.size.x + self.origin_offset.x),
-            random.uniform(0, self.size.y + self.origin_offset.y),
-        )
+    def random_position(self, *, rng: random.Random | None = None) -> Vector2:
+        """Return a uniformly distributed random position within the world.
+
+        See `random_positions`.
+        """
+        return self.random_positions(1, rng=rng)[0]
+
+    def random_positions(
+        self, n: int, *, rng: random.Random | None = None
+    ) -> list[Vector2]:
+        """Return `n` uniformly distributed random positions within the world.
 
-    def random_edge_position(self, offset: float = 0) -> Vector2:
+        `rng`: source of randomness; seed it for reproducible results.
+        Defaults to the `random` module's shared generator.
+        """
+        random_ = random.random if rng is None else rng.random
+        (min_x, min_y), _ = self._bounds()
+        size_x, size_y = self.size
+        return [
+            Vector2(min_x + size_x * random_(), min_y + size_y * random_())
+            for _ in range(n)
+        ]
+
+    def random_edge_position(
+        self, offset: float = 0, *, rng: random.Random | None = None
+    ) -> Vector2:
         """Return a random position on or offset from the edge of the world.
 
+        See `random_edge_positions`.
+        """
+        return self.random_edge_positions(1, offset, rng=rng)[0]
+
+    def random_edge_positions(
+        self, n: int, offset: float = 0, *, rng: random.Random | None = None
+    ) -> list[Vector2]:
+        """Return `n` random positions on or offset from the edge of the world.
+
         Uniformly distributed.
 
         -ve/+ve offset: offset in/out from edge.
+
+        `rng`: source of randomness; seed it for reproducible results.
+        Defaults to the `random` module's shared generator.
         """
+        random_ = random.random if rng is None else rng.random
+        (min_x, min_y), _ = self._bounds(offset)
         sx, sy = self.size + Vector2(2 * offset)
-        distance = random.uniform(0, 2 * sx + 2 * sy)
-        if distance < sx:
-            point = Vector2(distance, 0)
-        elif distance < sx + sy:
-            point = Vector2(sx, distance - sx)
-        elif distance < 2 * sx + sy:
-            point = Vector2(distance - sx - sy, sy)
-        else:
-            point = Vector2(0, distance - 2 * sx - sy)
-
-        return point + self.origin_offset - Vector2(offset)
+        perimeter = 2 * sx + 2 * sy
+        positions: list[Vector2] = []
+        for _ in range(n):
+            distance = perimeter * random_()
+            if distance < sx:
+                x, y = distance, 0.0
+            elif distance < sx + sy:
+                x, y = sx, distance - sx
+            elif distance < 2 * sx + sy:
+                x, y = distance - sx - sy, sy
+            else:
+                x, y = 0.0, distance - 2 * sx - sy
+
+            positions.append(Vector2(min_x + x, min_y + y))
+
+        return positions
 
     def add_entity(self, entity: Entity) -> None:
         """Add `entity` to the world."""
         self.entities.add(entity)
 
-    def update(self, delta_time: float) -> None:
-        """Update the world."""
-        for entity in self.entities:
+    def _collide(self) -> None:
+        """Find, and optionally resolve, overlapping entities."""
+        self.contact_entities = list(self.entities)
+        self.contacts = find_contacts(self.contact_entities)
+        if self.resolve_collisions:
+            resolve_contacts(
+                self.contact_entities, self.contacts, restitution=self.restitution
+            )
+
+    def close(self) -> None:
+        """Shut down the thread pool, if `threads` were used."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def shards(self) -> list[list[Entity]]:
+        """Return `entities` divided into one shard per thread, per `sharding`."""
+        entities = list(self.entities)
+        threads = self.threads
+        if threads == 1:
+            return [entities]
+
+        if self.sharding == "REGION":
+            entities.sort(key=lambda entity: entity.position.x)
+            shard_size = -(-len(entities) // threads)
+            return [
+                entities[i * shard_size : (i + 1) * shard_size] for i in range(threads)
+            ]
+
+        return [entities[i::threads] for i in range(threads)]
+
+    def _for_each_shard(
+        self, shards: list[list[Entity]], func: Callable[[list[Entity]], None]
+    ) -> None:
+        """Call `func` on each shard, on the thread pool; wait for all to finish."""
+        if self.threads == 1:
+            for shard in shards:
+                func(shard)
+
+            return
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.threads, thread_name_prefix="flatlandian-world"
+            )
+
+        futures = [self._executor.submit(func, shard) for shard in shards if shard]
+        for future in futures:
+            future.result()
+
+    @staticmethod
+    def _move(entities: list[Entity], delta_time: float) -> None:
+        for entity in entities:
             entity.update(delta_time)
 
+    def _contain(self, entities: list[Entity]) -> None:
+        min_, max_ = self._bounds()
+        for entity in entities:
+            if not self.position_is_in_bounds(entity.position, offset=-entity.radius):
+                contain(entity, min_, max_, restitution=self.restitution)
+
+    def update(self, delta_time: float) -> None:
+        """Update the world.
+
+        With `threads`, entities are moved, and contained, in parallel shards;
+        collisions are handled on the calling thread, between those stages.
+        """
+        shards = self.shards()
+        self._for_each_shard(shards, lambda shard: self._move(shard, delta_time))
+
+        if self.detect_collisions:
+            self._collide()
+
+        if self.contain_entities:
+            self._for_each_shard(shards, self._contain)
+
+        # Every shard has finished (barrier), so the step is complete...
         self.step_counter += 1
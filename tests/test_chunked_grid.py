@@ -0,0 +1,170 @@
+"""Tests for `ChunkedGrid` class."""
+
+import random
+from pathlib import Path
+
+import pytest
+
+from flatlandian.chunked_grid import ChunkedGrid
+from flatlandian.int_vector2 import IntVector2
+from flatlandian.navigation_grid import NavigationGrid
+
+
+def test_block_creates_chunk() -> None:
+    """Test that chunks are created on block, including at negative coords."""
+    # arrange
+    cg = ChunkedGrid(chunk_size=8)
+    # act
+    cg.block(IntVector2(-1, 20))
+    cg.unblock(IntVector2(100, 100))
+    # assert
+    assert cg.chunk_keys == {(-1, 2)}
+    assert not cg.is_traversable(IntVector2(-1, 20))
+    assert cg.is_traversable(IntVector2(-2, 20))
+    assert cg.is_traversable(IntVector2(7, 20))
+
+
+def test_route_across_chunks() -> None:
+    # arrange
+    cg = ChunkedGrid(chunk_size=4)
+    for y in range(-10, 10):
+        cg.block(IntVector2(0, y))
+    # act
+    route = cg.route(IntVector2(-3, 0), IntVector2(3, 0))
+    # assert
+    assert route is not None
+    assert route[0] == IntVector2(-3, 0)
+    assert route[-1] == IntVector2(3, 0)
+    assert all(cg.is_traversable(node) for node in route)
+    assert IntVector2(0, 10) in route or IntVector2(0, -11) in route
+
+
+def test_route_matches_navigation_grid() -> None:
+    """Test that routes are of the same length as `NavigationGrid.route`."""
+    # arrange
+    rng = random.Random(0)
+    ng = NavigationGrid(IntVector2(30, 30))
+    ng.blocked_nodes = {node for node in ng.nodes if rng.random() < 0.3}
+    cg = ChunkedGrid(chunk_size=8)
+    # Enclose the same area...
+    for i in range(-1, 31):
+        for node in (IntVector2(i, -1), IntVector2(i, 30)):
+            cg.block(node)
+        for node in (IntVector2(-1, i), IntVector2(30, i)):
+            cg.block(node)
+    for node in ng.blocked_nodes:
+        cg.block(node)
+    # act, assert
+    for _ in range(20):
+        from_node = IntVector2(rng.randrange(30), rng.randrange(30))
+        to_node = IntVector2(rng.randrange(30), rng.randrange(30))
+        route = cg.route(from_node, to_node)
+        expected = ng.route(from_node, to_node)
+        assert (route is None) == (expected is None)
+        if route is not None and expected is not None:
+            assert len(route) == len(expected)
+
+
+def test_route_max_expansions() -> None:
+    # arrange
+    cg = ChunkedGrid()
+    for offset in NavigationGrid.DIRECTIONS:
+        cg.block(IntVector2(100, 100) + offset)
+    # act
+    route = cg.route(IntVector2(0, 0), IntVector2(100, 100), max_expansions=1000)
+    # assert
+    assert route is None
+    assert cg.chunk_keys == {(1, 1)}
+
+
+def test_evict_to_store(tmp_path: Path) -> None:
+    """Test that least recently used chunks are evicted, and reloaded on access."""
+    # arrange
+    cg = ChunkedGrid(chunk_size=4, max_loaded_chunks=2, store=tmp_path)
+    # act
+    for x in range(0, 20, 4):
+        cg.block(IntVector2(x, 0))
+    # assert
+    assert cg.loaded_chunks == 2
+    assert len(cg.chunk_keys) == 5
+    assert not cg.is_traversable(IntVector2(0, 0))
+    assert cg.is_traversable(IntVector2(1, 0))
+    route = cg.route(IntVector2(-1, 0), IntVector2(20, 0))
+    assert route is not None
+    assert len(route) == 22
+
+
+def test_store_reopened(tmp_path: Path) -> None:
+    # arrange
+    cg = ChunkedGrid(store=tmp_path)
+    cg.block(IntVector2(-100, 5))
+    cg.flush()
+    # act
+    reopened = ChunkedGrid(store=tmp_path)
+    # assert
+    assert reopened.loaded_chunks == 0
+    assert not reopened.is_traversable(IntVector2(-100, 5))
+
+
+def test_store_reopened_after_read(tmp_path: Path) -> None:
+    """Test that reading stored chunks doesn't remove them from `store`."""
+    # arrange
+    cg = ChunkedGrid(chunk_size=4, store=tmp_path)
+    cg.block(IntVector2(1, 1))
+    cg.block(IntVector2(5, 1))
+    cg.flush()
+    reopened = ChunkedGrid(chunk_size=4, max_loaded_chunks=1, store=tmp_path)
+    # act
+    traversable = reopened.is_traversable(IntVector2(1, 1))
+    reopened.route(IntVector2(0, 0), IntVector2(7, 2))
+    # assert
+    assert not traversable
+    reopened_again = ChunkedGrid(chunk_size=4, store=tmp_path)
+    assert not reopened_again.is_traversable(IntVector2(1, 1))
+    assert not reopened_again.is_traversable(IntVector2(5, 1))
+
+
+def test_flush_writes_changes(tmp_path: Path) -> None:
+    # arrange
+    cg = ChunkedGrid(chunk_size=4, store=tmp_path)
+    cg.block(IntVector2(1, 1))
+    cg.flush()
+    reopened = ChunkedGrid(chunk_size=4, store=tmp_path)
+    reopened.unblock(IntVector2(1, 1))
+    reopened.block(IntVector2(2, 2))
+    # act
+    reopened.flush()
+    # assert
+    reopened_again = ChunkedGrid(chunk_size=4, store=tmp_path)
+    assert reopened_again.is_traversable(IntVector2(1, 1))
+    assert not reopened_again.is_traversable(IntVector2(2, 2))
+
+
+def test_create_max_loaded_chunks_without_store_raises_error() -> None:
+    # arrange
+    # act, assert
+    with pytest.raises(ValueError, match="requires `store`"):
+        ChunkedGrid(max_loaded_chunks=1)
+
+
+def test_create_max_loaded_chunks_not_positive_raises_error(tmp_path: Path) -> None:
+    # arrange
+    # act, assert
+    with pytest.raises(ValueError, match="positive `max_loaded_chunks`"):
+        ChunkedGrid(max_loaded_chunks=0, store=tmp_path)
+
+
+def test_route_keeps_max_loaded_chunks(tmp_path: Path) -> None:
+    """Test that a route through many stored chunks keeps few loaded."""
+    # arrange
+    cg = ChunkedGrid(chunk_size=4, max_loaded_chunks=1, store=tmp_path)
+    for x in range(2, 40, 4):
+        for y in range(-1, 3):
+            cg.block(IntVector2(x, y))
+    # act
+    route = cg.route(IntVector2(0, 0), IntVector2(40, 0))
+    # assert
+    assert route is not None
+    assert route[-1] == IntVector2(40, 0)
+    assert cg.loaded_chunks == 1
+    assert not cg.is_traversable(IntVector2(2, 0))
@@ -0,0 +1,99 @@
+"""Tests for `collision` module."""
+
+import random
+
+from pygame.math import Vector2
+
+from flatlandian import collision
+from flatlandian.entity import Entity
+
+
+def test_find_contacts() -> None:
+    """Test that overlapping entities are found, and touching ones aren't."""
+    # arrange
+    entities = [
+        Entity(position=Vector2(0, 0), velocity=Vector2(), radius=1),
+        Entity(position=Vector2(1.5, 0), velocity=Vector2(), radius=1),
+        Entity(position=Vector2(3.5, 0), velocity=Vector2(), radius=1),
+        Entity(position=Vector2(50, 50), velocity=Vector2(), radius=1),
+    ]
+    # act
+    first, second = collision.find_contacts(entities)
+    # assert
+    assert list(zip(first, second, strict=True)) == [(0, 1)]
+
+
+def test_find_contacts_matches_brute_force() -> None:
+    # arrange
+    rng = random.Random(1)
+    entities = [
+        Entity(
+            position=Vector2(rng.uniform(-50, 50), rng.uniform(-50, 50)),
+            velocity=Vector2(),
+            radius=rng.uniform(0.5, 3),
+        )
+        for _ in range(300)
+    ]
+    expected = {
+        (i, j)
+        for i, a in enumerate(entities)
+        for j, b in enumerate(entities)
+        if i < j and a.distance_to_squared(b) < (a.radius + b.radius) ** 2
+    }
+    # act
+    first, second = collision.find_contacts(entities)
+    # assert
+    assert set(zip(first, second, strict=True)) == expected
+    assert len(first) == len(expected)
+
+
+def test_find_contacts_mixed_radii_matches_brute_force() -> None:
+    """Test that a large entity among many small ones is found in contact."""
+    # arrange
+    rng = random.Random(2)
+    entities = [
+        Entity(
+            position=Vector2(rng.uniform(-50, 50), rng.uniform(-50, 50)),
+            velocity=Vector2(),
+            radius=rng.uniform(0.5, 1),
+        )
+        for _ in range(300)
+    ]
+    entities.append(Entity(position=Vector2(10, -5), velocity=Vector2(), radius=30))
+    expected = {
+        (i, j)
+        for i, a in enumerate(entities)
+        for j, b in enumerate(entities)
+        if i < j and a.distance_to_squared(b) < (a.radius + b.radius) ** 2
+    }
+    # act
+    first, second = collision.find_contacts(entities)
+    # assert
+    assert set(zip(first, second, strict=True)) == expected
+    assert len(first) == len(expected)
+
+
+def test_resolve_contacts() -> None:
+    """Test that entities are separated, and their velocities exchanged."""
+    # arrange
+    a = Entity(position=Vector2(0, 0), velocity=Vector2(1, 0), radius=1)
+    b = Entity(position=Vector2(1, 0), velocity=Vector2(-1, 0), radius=1)
+    # act
+    collision.resolve_contacts([a, b], collision.find_contacts([a, b]))
+    # assert
+    assert a.position == Vector2(-0.5, 0)
+    assert b.position == Vector2(1.5, 0)
+    assert a.velocity == Vector2(-1, 0)
+    assert b.velocity == Vector2(1, 0)
+
+
+def test_contain() -> None:
+    """Test that an entity crossing an edge is moved back, and bounced."""
+    # arrange
+    e = Entity(position=Vector2(9.5, 5), velocity=Vector2(2, 1), radius=1)
+    # act
+    moved = collision.contain(e, Vector2(0, 0), Vector2(10, 10))
+    # assert
+    assert moved
+    assert e.position == Vector2(9, 5)
+    assert e.velocity == Vector2(-2, 1)
@@ -0,0 +1,125 @@
+"""Tests for `cooperative` module."""
+
+import pytest
+
+from flatlandian.cooperative import ReservationTable, plan_cooperative_routes
+from flatlandian.int_vector2 import IntVector2
+from flatlandian.navigation_grid import NavigationGrid
+
+
+def _corridor() -> NavigationGrid:
+    """Return a 7x3 grid with a 1-wide corridor along y=1, and a passing bay."""
+    ng = NavigationGrid(IntVector2(7, 3))
+    ng.blocked_nodes = {
+        IntVector2(x, y) for x in range(7) for y in (0, 2) if (x, y) != (3, 2)
+    }
+    return ng
+
+
+def _assert_no_collisions(
+    agents: list[tuple[IntVector2, IntVector2]],
+    routes: list[list[IntVector2] | None],
+) -> None:
+    """Assert that agents staying at the ends of `routes` never share or swap cells.
+
+    Agents without a route stay at their start.
+    """
+    positions: list[list[IntVector2]] = []
+    for (start, _), route in zip(agents, routes, strict=True):
+        path = route or []
+        positions.append([start, *path, *[path[-1] if path else start] * 20])
+
+    for t in range(1, 20):
+        for i, j in ((0, 1), (1, 0)):
+            assert positions[i][t] != positions[j][t]
+            assert (positions[i][t - 1], positions[i][t]) != (
+                positions[j][t],
+                positions[j][t - 1],
+            )
+
+
+def test_reservation_table_window() -> None:
+    """Test that reservations beyond the window are discarded."""
+    # arrange
+    table = ReservationTable(IntVector2(2, 2), window=2)
+    # act
+    table.reserve(IntVector2(1, 1), 1, agent=0)
+    table.reserve(IntVector2(1, 1), 2, agent=0)
+    # assert
+    assert len(table) == 1
+    assert table.owner(IntVector2(1, 1), 1) == 0
+    assert table.is_free(IntVector2(1, 1), 1, agent=0)
+    assert not table.is_free(IntVector2(1, 1), 1, agent=1)
+
+
+def test_plan_cooperative_routes_avoid_each_other() -> None:
+    """Test that agents passing in a corridor never share or swap cells."""
+    # arrange
+    ng = _corridor()
+    agents = [
+        (IntVector2(0, 1), IntVector2(6, 1)),
+        (IntVector2(6, 1), IntVector2(0, 1)),
+    ]
+    # act
+    routes = plan_cooperative_routes(ng, agents)
+    # assert
+    assert routes[0] is not None
+    assert routes[1] is not None
+    assert routes[0][-1] == IntVector2(6, 1)
+    assert routes[1][-1] == IntVector2(0, 1)
+    _assert_no_collisions(agents, routes)
+
+
+def test_plan_cooperative_routes_unreachable() -> None:
+    # arrange
+    ng = _corridor()
+    # act
+    routes = plan_cooperative_routes(ng, [(IntVector2(0, 1), IntVector2(0, 0))])
+    # assert
+    assert routes == [None]
+
+
+def test_reservation_table_reserve_reserved_raises_error() -> None:
+    """Test that another agent's reservation isn't overwritten."""
+    # arrange
+    table = ReservationTable(IntVector2(2, 2))
+    table.reserve(IntVector2(1, 1), 1, agent=0)
+    # act, assert
+    with pytest.raises(ValueError, match="reserved by agent 0"):
+        table.reserve(IntVector2(1, 1), 1, agent=1)
+    assert table.owner(IntVector2(1, 1), 1) == 0
+
+
+def test_plan_cooperative_routes_goal_on_higher_priority_route() -> None:
+    """Test that an agent doesn't stop on a cell a higher priority agent needs."""
+    # arrange
+    ng = _corridor()
+    agents = [
+        (IntVector2(0, 1), IntVector2(6, 1)),
+        (IntVector2(3, 2), IntVector2(4, 1)),
+    ]
+    # act
+    routes = plan_cooperative_routes(ng, agents)
+    # assert
+    _assert_no_collisions(agents, routes)
+    assert routes[0] is not None
+    assert routes[1] is not None
+    assert routes[0][-1] == IntVector2(6, 1)
+
+
+def test_plan_cooperative_routes_avoid_agent_without_route() -> None:
+    """Test that agents avoid an agent without a route, which stays at its start."""
+    # arrange
+    ng = NavigationGrid(IntVector2(5, 1))
+    ng.blocked_nodes = {IntVector2(4, 0)}
+    agents = [
+        (IntVector2(2, 0), IntVector2(4, 0)),
+        (IntVector2(0, 0), IntVector2(3, 0)),
+    ]
+    # act
+    routes = plan_cooperative_routes(ng, agents, window=4)
+    # assert
+    assert routes[0] is None
+    assert routes[1] is not None
+    assert IntVector2(2, 0) not in routes[1]
+    _assert_no_collisions(agents, routes)
@@ -1,7 +1,12 @@
 """Tests for `geometry` module."""
 
+import math
+
+import pytest
+
 from flatlandian import geometry
 from flatlandian.grid import Grid
+from flatlandian.int_vector2 import IntVector2
 
 
 def test_absolute_bearing__vector2() -> None:
@@ -33,3 +38,19 @@ def test_relative_bearing() -> None:
     # assert
     assert bearings_from_0 == [0, 45, 90, 135, 180, -135, -90, -45]
     assert bearings_from_180 == [180, -135, -90, -45, 0, 45, 90, 135]
+
+
+def test_octile_distance() -> None:
+    # arrange
+    # act
+    distance = geometry.octile_distance(IntVector2(0, 0), IntVector2(3, -1))
+    # assert
+    assert distance == pytest.approx(2 + math.sqrt(2))
+
+
+def test_octile_length() -> None:
+    # arrange
+    # act
+    length = geometry.octile_length(-1, 3)
+    # assert
+    assert length == geometry.octile_distance(IntVector2(0, 0), IntVector2(-1, 3))
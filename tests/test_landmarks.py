@@ -0,0 +1,45 @@
+"""Tests for `Landmarks` class."""
+
+import math
+from array import array
+
+import pytest
+
+from flatlandian.int_vector2 import IntVector2
+from flatlandian.landmarks import Landmarks
+
+
+def _landmarks() -> Landmarks:
+    """Return landmarks for a 3x1 map, at each end."""
+    return Landmarks(
+        size=IntVector2(3, 1),
+        nodes=(IntVector2(0, 0), IntVector2(2, 0)),
+        distances=(array("d", [0, 1, 2]), array("d", [2, 1, math.inf])),
+        checksum=123,
+    )
+
+
+def test_heuristic() -> None:
+    # arrange
+    landmarks = _landmarks()
+    # act
+    heuristic = landmarks.heuristic(2)
+    # assert
+    assert [heuristic(i) for i in range(3)] == [2, 1, 0]
+
+
+def test_bytes_round_trip() -> None:
+    # arrange
+    landmarks = _landmarks()
+    # act
+    data = landmarks.to_bytes()
+    # assert
+    assert Landmarks.from_bytes(data) == landmarks
+
+
+def test_from_bytes_truncated_raises_error() -> None:
+    # arrange
+    data = _landmarks().to_bytes()
+    # act, assert
+    with pytest.raises(ValueError, match="bytes"):
+        Landmarks.from_bytes(data[:-1])
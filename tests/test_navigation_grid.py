@@ -1,7 +1,14 @@
 """Tests for `NavigationGrid` class."""
 
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
 from flatlandian.int_vector2 import IntVector2
-from flatlandian.navigation_grid import NavigationGrid
+from flatlandian.navigation_grid import NavigationGrid, SearchStats
 
 
 def test_create() -> None:
@@ -17,3 +24,401 @@ def test_create() -> None:
     }
     assert isinstance(ng.nodes, frozenset)
     assert ng.blocked_nodes == set()
+
+
+def test_route() -> None:
+    # arrange
+    ng = NavigationGrid(IntVector2(3, 3))
+    ng.blocked_nodes = {IntVector2(1, 0), IntVector2(1, 1)}
+    # act
+    route = ng.route(IntVector2(0, 0), IntVector2(2, 0))
+    # assert
+    assert route == [
+        IntVector2(0, 0),
+        IntVector2(0, 1),
+        IntVector2(1, 2),
+        IntVector2(2, 1),
+        IntVector2(2, 0),
+    ]
+
+
+def test_route_no_route() -> None:
+    # arrange
+    ng = NavigationGrid(IntVector2(3, 3))
+    ng.blocked_nodes = {IntVector2(1, 0), IntVector2(1, 1), IntVector2(1, 2)}
+    # act
+    route = ng.route(IntVector2(0, 0), IntVector2(2, 0))
+    # assert
+    assert route is None
+
+
+def test_route_stats() -> None:
+    """Test that search counters are populated, and hook called per expansion."""
+    # arrange
+    ng = NavigationGrid(IntVector2(5, 5))
+    stats = SearchStats()
+    expanded: list[IntVector2] = []
+    # act
+    ng.route(IntVector2(0, 0), IntVector2(4, 4), stats=stats, on_expand=expanded.append)
+    # assert
+    assert stats.early_exit
+    assert stats.nodes_expanded == len(expanded) > 0
+    assert expanded[0] == IntVector2(0, 0)
+    assert stats.nodes_pushed >= stats.peak_frontier > 0
+    assert stats.elapsed > 0
+
+
+def test_route_without_stats_does_not_time(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the uninstrumented path doesn't read the clock."""
+    # arrange
+    ng = NavigationGrid(IntVector2(5, 5))
+    calls: list[None] = []
+
+    def perf_counter() -> float:
+        calls.append(None)
+        return 0
+
+    monkeypatch.setattr(time, "perf_counter", perf_counter)
+    # act
+    for algorithm in ("UNIFORM_COST_SEARCH", "BIDIRECTIONAL_UNIFORM_COST_SEARCH"):
+        ng.route(IntVector2(0, 0), IntVector2(4, 4), algorithm)
+    # assert
+    assert not calls
+
+
+def test_route_stats_no_route() -> None:
+    # arrange
+    ng = NavigationGrid(IntVector2(3, 3))
+    ng.blocked_nodes = {IntVector2(1, 0), IntVector2(1, 1), IntVector2(1, 2)}
+    stats = SearchStats()
+    # act
+    ng.route(IntVector2(0, 0), IntVector2(2, 0), stats=stats)
+    # assert
+    assert not stats.early_exit
+    assert stats.nodes_expanded == 3
+
+
+def test_route_out_of_bounds() -> None:
+    # arrange
+    ng = NavigationGrid(IntVector2(3, 3))
+    # act
+    route = ng.route(IntVector2(0, 0), IntVector2(3, 0))
+    # assert
+    assert route is None
+
+
+def test_route_stats_no_reexpansion() -> None:
+    """Test that each node is expanded at most once."""
+    # arrange
+    ng = NavigationGrid(IntVector2(8, 8))
+    ng.blocked_nodes = {IntVector2(4, y) for y in range(7)}
+    expanded: list[IntVector2] = []
+    # act
+    ng.route(IntVector2(0, 0), IntVector2(7, 0), on_expand=expanded.append)
+    # assert
+    assert len(expanded) == len(set(expanded))
+
+
+def test_route_bidirectional() -> None:
+    """Test that bidirectional search finds a route of the same cost."""
+    # arrange
+    ng = NavigationGrid(IntVector2(9, 9))
+    ng.blocked_nodes = {IntVector2(4, y) for y in range(8)}
+    # act
+    route = ng.route(IntVector2(0, 0), IntVector2(8, 0))
+    bidirectional_route = ng.route(
+        IntVector2(0, 0), IntVector2(8, 0), "BIDIRECTIONAL_UNIFORM_COST_SEARCH"
+    )
+    # assert
+    assert route is not None
+    assert bidirectional_route is not None
+    assert len(bidirectional_route) == len(route)
+    assert bidirectional_route[0] == IntVector2(0, 0)
+    assert bidirectional_route[-1] == IntVector2(8, 0)
+    assert IntVector2(4, 8) in bidirectional_route
+
+
+def test_route_bidirectional_no_route() -> None:
+    # arrange
+    ng = NavigationGrid(IntVector2(3, 3))
+    ng.blocked_nodes = {IntVector2(1, 0), IntVector2(1, 1), IntVector2(1, 2)}
+    # act
+    route = ng.route(
+        IntVector2(0, 0), IntVector2(2, 0), "BIDIRECTIONAL_UNIFORM_COST_SEARCH"
+    )
+    # assert
+    assert route is None
+
+
+def test_route_bidirectional_a_star() -> None:
+    """Test that bidirectional A* finds a route of the same cost, more cheaply."""
+    # arrange
+    ng = NavigationGrid(IntVector2(20, 20))
+    ng.blocked_nodes = {IntVector2(10, y) for y in range(1, 20)}
+    ucs_stats, a_star_stats = SearchStats(), SearchStats()
+    # act
+    route = ng.route(
+        IntVector2(0, 19),
+        IntVector2(19, 19),
+        "BIDIRECTIONAL_UNIFORM_COST_SEARCH",
+        stats=ucs_stats,
+    )
+    a_star_route = ng.route(
+        IntVector2(0, 19),
+        IntVector2(19, 19),
+        "BIDIRECTIONAL_A_STAR",
+        stats=a_star_stats,
+    )
+    # assert
+    assert route is not None
+    assert a_star_route is not None
+    assert len(a_star_route) == len(route)
+    assert a_star_route[0] == IntVector2(0, 19)
+    assert a_star_route[-1] == IntVector2(19, 19)
+    assert a_star_stats.nodes_expanded < ucs_stats.nodes_expanded
+
+
+def test_route_a_star() -> None:
+    """Test that A* finds a route of the same cost, with fewer expansions."""
+    # arrange
+    ng = NavigationGrid(IntVector2(20, 20))
+    ng.blocked_nodes = {IntVector2(10, y) for y in range(1, 20)}
+    ucs_stats, a_star_stats = SearchStats(), SearchStats()
+    # act
+    route = ng.route(IntVector2(0, 19), IntVector2(19, 19), stats=ucs_stats)
+    a_star_route = ng.route(
+        IntVector2(0, 19), IntVector2(19, 19), "A_STAR", stats=a_star_stats
+    )
+    # assert
+    assert route is not None
+    assert a_star_route is not None
+    assert len(a_star_route) == len(route)
+    assert a_star_stats.nodes_expanded < ucs_stats.nodes_expanded
+
+
+def test_route_a_star_landmarks() -> None:
+    """Test that A* with landmarks finds a route of the same cost."""
+    # arrange
+    ng = NavigationGrid(IntVector2(20, 20))
+    ng.blocked_nodes = {IntVector2(10, y) for y in range(1, 20)}
+    route = ng.route(IntVector2(0, 19), IntVector2(19, 19), "A_STAR")
+    ng.preprocess_landmarks(4)
+    # act
+    alt_route = ng.route(IntVector2(0, 19), IntVector2(19, 19), "A_STAR")
+    # assert
+    assert route is not None
+    assert alt_route is not None
+    assert len(alt_route) == len(route)
+
+
+def test_load_landmarks(tmp_path: Path) -> None:
+    # arrange
+    ng = NavigationGrid(IntVector2(5, 5))
+    ng.blocked_nodes = {IntVector2(2, 2)}
+    landmarks = ng.preprocess_landmarks(2)
+    landmarks.save(tmp_path / "landmarks")
+    other = NavigationGrid(IntVector2(5, 5))
+    other.blocked_nodes = {IntVector2(2, 2)}
+    # act
+    other.load_landmarks(tmp_path / "landmarks")
+    # assert
+    assert other.landmarks == landmarks
+
+
+def test_load_landmarks_different_map_raises_error(tmp_path: Path) -> None:
+    # arrange
+    ng = NavigationGrid(IntVector2(5, 5))
+    ng.preprocess_landmarks(2).save(tmp_path / "landmarks")
+    other = NavigationGrid(IntVector2(5, 5))
+    other.blocked_nodes = {IntVector2(2, 2)}
+    # act, assert
+    with pytest.raises(ValueError, match="different map"):
+        other.load_landmarks(tmp_path / "landmarks")
+
+
+def test_visible_cells_cached_and_invalidated() -> None:
+    """Test that views are cached, and invalidated by blocking within radius."""
+    # arrange
+    ng = NavigationGrid(IntVector2(10, 10))
+    view = ng.visible_cells(IntVector2(2, 2), 3)
+    far_view = ng.visible_cells(IntVector2(8, 8), 3)
+    # act
+    ng.block(IntVector2(3, 2))
+    # assert
+    assert IntVector2(4, 2) in view
+    assert ng.visible_cells(IntVector2(8, 8), 3) is far_view
+    assert IntVector2(4, 2) not in ng.visible_cells(IntVector2(2, 2), 3)
+
+
+def test_has_line_of_sight() -> None:
+    # arrange
+    ng = NavigationGrid(IntVector2(5, 5))
+    ng.block(IntVector2(2, 2))
+    # act
+    # assert
+    assert not ng.has_line_of_sight(IntVector2(0, 0), IntVector2(4, 4))
+    assert ng.has_line_of_sight(IntVector2(0, 0), IntVector2(4, 0))
+
+
+@pytest.mark.parametrize(
+    "algorithm",
+    [
+        "UNIFORM_COST_SEARCH",
+        "A_STAR",
+        "BIDIRECTIONAL_UNIFORM_COST_SEARCH",
+        "BIDIRECTIONAL_A_STAR",
+    ],
+)
+def test_route_should_stop(algorithm: str) -> None:
+    """Test that a stopped search returns a route toward `to_node`."""
+    # arrange
+    ng = NavigationGrid(IntVector2(100, 100))
+    # act
+    route = ng.route(
+        IntVector2(0, 0), IntVector2(99, 0), algorithm, should_stop=lambda: True
+    )
+    # assert
+    assert route is not None
+    assert route[0] == IntVector2(0, 0)
+    assert 1 < len(route) < 100
+    assert route[-1].x > 0
+
+
+@pytest.mark.parametrize("algorithm", ["UNIFORM_COST_SEARCH", "A_STAR"])
+def test_start_route(algorithm: str) -> None:
+    """Test that a stepped search finds the same route as `route`."""
+    # arrange
+    ng = NavigationGrid(IntVector2(20, 20))
+    ng.blocked_nodes = {IntVector2(10, y) for y in range(1, 20)}
+    search = ng.start_route(IntVector2(0, 19), IntVector2(19, 19), algorithm)
+    steps = 0
+    # act
+    while not search.step(10):
+        steps += 1
+        assert search.result is None
+    # assert
+    assert steps > 1
+    assert search.nodes_expanded <= (steps + 1) * 10
+    assert search.result == ng.route(IntVector2(0, 19), IntVector2(19, 19), algorithm)
+
+
+def test_start_route_no_route() -> None:
+    # arrange
+    ng = NavigationGrid(IntVector2(5, 5))
+    ng.blocked_nodes = {IntVector2(2, y) for y in range(5)}
+    search = ng.start_route(IntVector2(0, 0), IntVector2(4, 4))
+    # act
+    search.step(1000)
+    # assert
+    assert search.is_done
+    assert search.result is None
+
+
+def test_start_route_blocked_goal_is_done() -> None:
+    # arrange
+    ng = NavigationGrid(IntVector2(5, 5))
+    ng.block(IntVector2(4, 4))
+    # act
+    search = ng.start_route(IntVector2(0, 0), IntVector2(4, 4))
+    # assert
+    assert search.is_done
+    assert search.result is None
+
+
+def test_start_route_cancel() -> None:
+    # arrange
+    ng = NavigationGrid(IntVector2(50, 50))
+    search = ng.start_route(IntVector2(0, 0), IntVector2(49, 49))
+    search.step(10)
+    # act
+    search.cancel()
+    # assert
+    assert search.is_done
+    assert search.result is None
+    assert search.step(10)
+
+
+@pytest.mark.parametrize(
+    "algorithm", ["BIDIRECTIONAL_UNIFORM_COST_SEARCH", "BIDIRECTIONAL_A_STAR"]
+)
+def test_start_route_bidirectional(algorithm: str) -> None:
+    """Test that a stepped bidirectional search finds the same route as `route`."""
+    # arrange
+    ng = NavigationGrid(IntVector2(20, 20))
+    ng.blocked_nodes = {IntVector2(10, y) for y in range(1, 20)}
+    expected = ng.route(IntVector2(0, 19), IntVector2(19, 19), algorithm)
+    search = ng.start_route(IntVector2(0, 19), IntVector2(19, 19), algorithm)
+    steps = 0
+    # act
+    while not search.step(10):
+        steps += 1
+        assert search.nodes_expanded == 10 * steps
+    # assert
+    assert steps > 1
+    assert search.result == expected
+
+
+def test_import_does_not_import_pygame() -> None:
+    """Test that a headless routing worker doesn't pay to import Pygame."""
+    # arrange
+    code = (
+        "import sys\n"
+        "from flatlandian import geometry, navigation_grid\n"
+        "print('pygame' in sys.modules)\n"
+    )
+    # act
+    output = subprocess.run(  # noqa: S603 - runs this interpreter on fixed code
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    ).stdout
+    # assert
+    assert output.strip() == "False"
+
+
+def test_unblock_clears_landmarks() -> None:
+    """Test that A* stays optimal after unblocking invalidates landmarks."""
+    # arrange
+    ng = NavigationGrid(IntVector2(20, 20))
+    ng.blocked_nodes = {IntVector2(10, y) for y in range(1, 20)}
+    ng.preprocess_landmarks(4)
+    # act
+    ng.unblock(IntVector2(10, 19))
+    # assert
+    assert ng.landmarks is None
+    route = ng.route(IntVector2(0, 19), IntVector2(19, 19), "A_STAR")
+    assert route == [IntVector2(x, 19) for x in range(20)]
+
+
+def test_set_blocked_nodes_clears_visibility_cache() -> None:
+    # arrange
+    ng = NavigationGrid(IntVector2(5, 5))
+    view = ng.visible_cells(IntVector2(0, 0), 4)
+    # act
+    ng.blocked_nodes = {IntVector2(1, 0)}
+    # assert
+    assert IntVector2(3, 0) in view
+    assert IntVector2(3, 0) not in ng.visible_cells(IntVector2(0, 0), 4)
+
+
+def test_blocked_nodes() -> None:
+    """Test that `blocked_nodes` is a read-only view of blocked nodes."""
+    # arrange
+    ng = NavigationGrid(IntVector2(5, 5))
+    # act
+    ng.blocked_nodes = {IntVector2(1, 1)}
+    ng.block(IntVector2(4, 4))
+    ng.unblock(IntVector2(1, 1))
+    # assert
+    assert ng.blocked_nodes == {IntVector2(4, 4)}
+    assert IntVector2(4, 4) in ng.blocked_nodes
+    assert IntVector2(9, 9) not in ng.blocked_nodes
+    assert not hasattr(ng.blocked_nodes, "add")
+
+
+def test_block_out_of_bounds_raises_error() -> None:
+    # arrange
+    ng = NavigationGrid(IntVector2(5, 5))
+    # act, assert
+    with pytest.raises(ValueError, match="out of bounds"):
+        ng.block(IntVector2(5, 0))
+    with pytest.raises(ValueError, match="out of bounds"):
+        ng.blocked_nodes = {IntVector2(-1, 0)}
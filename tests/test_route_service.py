@@ -0,0 +1,157 @@
+"""Tests for `RouteService` class."""
+
+import asyncio
+
+import pytest
+
+from flatlandian.int_vector2 import IntVector2
+from flatlandian.navigation_grid import NavigationGrid
+from flatlandian.route_service import RouteService
+
+
+def test_route() -> None:
+    """Test that the route matches `NavigationGrid.route`."""
+    # arrange
+    ng = NavigationGrid(IntVector2(10, 10))
+    ng.blocked_nodes = {IntVector2(5, y) for y in range(9)}
+
+    async def main() -> list[IntVector2] | None:
+        async with RouteService(ng) as service:
+            return await service.route(IntVector2(0, 0), IntVector2(9, 0))
+
+    # act
+    route = asyncio.run(main())
+    # assert
+    assert route == ng.route(IntVector2(0, 0), IntVector2(9, 0), "A_STAR")
+
+
+def test_route_bidirectional() -> None:
+    """Test that a bidirectional algorithm's route matches `NavigationGrid.route`."""
+    # arrange
+    ng = NavigationGrid(IntVector2(10, 10))
+    ng.blocked_nodes = {IntVector2(5, y) for y in range(9)}
+
+    async def main() -> list[IntVector2] | None:
+        async with RouteService(ng, algorithm="BIDIRECTIONAL_A_STAR") as service:
+            return await service.route(IntVector2(0, 0), IntVector2(9, 0))
+
+    # act
+    route = asyncio.run(main())
+    # assert
+    assert route == ng.route(IntVector2(0, 0), IntVector2(9, 0), "BIDIRECTIONAL_A_STAR")
+
+
+def test_route_coalesced() -> None:
+    """Test that identical concurrent requests share a search."""
+    # arrange
+    ng = NavigationGrid(IntVector2(50, 50))
+
+    async def main() -> tuple[tuple[list[IntVector2] | None, ...], RouteService]:
+        async with RouteService(ng) as service:
+            routes = await asyncio.gather(
+                service.route(IntVector2(0, 0), IntVector2(49, 49)),
+                service.route(IntVector2(0, 0), IntVector2(49, 49)),
+                service.route(IntVector2(49, 49), IntVector2(0, 0)),
+            )
+            return routes, service
+
+    # act
+    routes, service = asyncio.run(main())
+    # assert
+    assert routes[0] == routes[1]
+    assert routes[2] is not None
+    assert service.metrics.requests == 3
+    assert service.metrics.coalesced == 1
+    assert service.metrics.in_flight == 0
+
+
+def test_route_time_limit() -> None:
+    """Test that a search out of time returns a best-effort route."""
+    # arrange
+    ng = NavigationGrid(IntVector2(200, 200))
+
+    async def main() -> tuple[list[IntVector2] | None, RouteService]:
+        async with RouteService(ng, algorithm="UNIFORM_COST_SEARCH") as service:
+            route = await service.route(
+                IntVector2(0, 0), IntVector2(199, 199), time_limit=0
+            )
+            return route, service
+
+    # act
+    route, service = asyncio.run(main())
+    # assert
+    assert route is not None
+    assert route[0] == IntVector2(0, 0)
+    assert route[-1] != IntVector2(199, 199)
+    assert service.metrics.stopped_early == 1
+
+
+def test_route_cancelled() -> None:
+    """Test that cancelling the only request for a search stops it."""
+    # arrange
+    ng = NavigationGrid(IntVector2(300, 300))
+
+    async def main() -> RouteService:
+        async with RouteService(ng, algorithm="UNIFORM_COST_SEARCH") as service:
+            task = asyncio.create_task(
+                service.route(IntVector2(0, 0), IntVector2(299, 299))
+            )
+            await asyncio.sleep(0)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            return service
+
+    # act
+    service = asyncio.run(main())
+    # assert
+    assert service.metrics.in_flight == 0
+
+
+def test_route_time_limit_coalesced() -> None:
+    """Test that each coalesced request keeps its own time limit."""
+    # arrange
+    ng = NavigationGrid(IntVector2(200, 200))
+    goal = IntVector2(199, 199)
+
+    async def main() -> tuple[tuple[list[IntVector2] | None, ...], RouteService]:
+        async with RouteService(ng, algorithm="UNIFORM_COST_SEARCH") as service:
+            routes = await asyncio.gather(
+                service.route(IntVector2(0, 0), goal),
+                service.route(IntVector2(0, 0), goal, time_limit=0.05),
+            )
+            return routes, service
+
+    # act
+    (full_route, partial_route), service = asyncio.run(main())
+    # assert
+    assert full_route is not None
+    assert full_route[-1] == goal
+    assert partial_route is not None
+    assert partial_route[-1] != goal
+    assert service.metrics.coalesced == 1
+    assert service.metrics.stopped_early == 1
+
+
+def test_close_pending_requests_raise_error() -> None:
+    """Test that requests pending when the service is closed raise an error."""
+    # arrange
+    ng = NavigationGrid(IntVector2(300, 300))
+
+    async def main() -> list[object]:
+        service = RouteService(ng, algorithm="UNIFORM_COST_SEARCH")
+        tasks = [
+            asyncio.create_task(service.route(IntVector2(0, 0), IntVector2(299, y)))
+            for y in (0, 299)
+        ]
+        await asyncio.sleep(0.01)
+        # act
+        service.close()
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    results = asyncio.run(main())
+    # assert
+    assert all(isinstance(result, RuntimeError) for result in results)
+    closed_service = RouteService(ng)
+    closed_service.close()
+    with pytest.raises(RuntimeError, match="closed"):
+        asyncio.run(closed_service.route(IntVector2(0, 0), IntVector2(1, 1)))
@@ -0,0 +1,65 @@
+"""Tests for `SpatialHash` class."""
+
+import random
+
+import pytest
+from pygame.math import Vector2
+
+from flatlandian.spatial_hash import SpatialHash
+
+
+def test_create_zero_cell_size_raises_error() -> None:
+    # arrange
+    # act, assert
+    with pytest.raises(ValueError, match="cell_size"):
+        SpatialHash(0)
+
+
+def test_from_coordinates_matches_insert() -> None:
+    # arrange
+    xs, ys = [-1.5, 0.0, 0.5, 7.0], [2.0, 0.0, -0.5, 7.0]
+    expected = SpatialHash(cell_size=1)
+    for x, y in zip(xs, ys, strict=True):
+        expected.insert(x, y)
+    # act
+    sh = SpatialHash.from_coordinates(xs, ys, cell_size=1)
+    # assert
+    assert sh.buckets == expected.buckets
+    assert (sh.xs, sh.ys) == (expected.xs, expected.ys)
+
+
+def test_candidate_pairs() -> None:
+    """Test that near pairs are yielded once each, and distant pairs not at all."""
+    # arrange
+    positions = [Vector2(0, 0), Vector2(0.5, 0.5), Vector2(1.5, 0), Vector2(9, 9)]
+    sh = SpatialHash.from_positions(positions, cell_size=1)
+    # act
+    pairs = [tuple(sorted(p)) for p in sh.candidate_pairs()]
+    # assert
+    assert sorted(pairs) == [(0, 1), (0, 2), (1, 2)]
+
+
+def test_query() -> None:
+    """Test that points within radius are found, including on negative coords."""
+    # arrange
+    positions = [Vector2(-1, -1), Vector2(0, 0), Vector2(3, 0)]
+    sh = SpatialHash.from_positions(positions, cell_size=1)
+    # act
+    found = set(sh.query(0, 0, 1.5))
+    # assert
+    assert found == {0, 1}
+
+
+def test_neighbor_lists_matches_query() -> None:
+    # arrange
+    rng = random.Random(0)
+    positions = [
+        Vector2(rng.uniform(-20, 20), rng.uniform(-20, 20)) for _ in range(200)
+    ]
+    sh = SpatialHash.from_positions(positions, cell_size=3)
+    # act
+    neighbors = sh.neighbor_lists()
+    # assert
+    for i, position in enumerate(positions):
+        expected = set(sh.query(position.x, position.y, 3)) - {i}
+        assert set(neighbors[i]) == expected
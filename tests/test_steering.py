@@ -0,0 +1,135 @@
+"""Tests for `steering` module."""
+
+import pytest
+from pygame.math import Vector2
+
+from flatlandian.entity import Entity
+from flatlandian.steering import Steering, limit_speed
+
+
+def test_seek() -> None:
+    # arrange
+    entity = Entity(position=Vector2(0, 0), velocity=Vector2(0, 1))
+    steering = Steering([entity], max_speed=2, max_force=100)
+    # act
+    steering.seek([Vector2(10, 0)])
+    steering.apply()
+    # assert
+    assert entity.acceleration == Vector2(2, -1)
+
+
+def test_flee() -> None:
+    # arrange
+    entity = Entity(position=Vector2(0, 0), velocity=Vector2(0, 0))
+    steering = Steering([entity], max_speed=2, max_force=100)
+    # act
+    steering.flee([Vector2(10, 0)])
+    steering.apply()
+    # assert
+    assert entity.acceleration == Vector2(-2, 0)
+
+
+def test_arrive() -> None:
+    """Test that speed is reduced within `slowing_radius`, and 0 at the target."""
+    # arrange
+    entities = [
+        Entity(position=Vector2(0, 0), velocity=Vector2(0, 0)),
+        Entity(position=Vector2(10, 0), velocity=Vector2(1, 0)),
+    ]
+    steering = Steering(entities, max_speed=4, max_force=100)
+    # act
+    steering.arrive([Vector2(5, 0), Vector2(10, 0)], slowing_radius=10)
+    steering.apply()
+    # assert
+    assert entities[0].acceleration == Vector2(2, 0)
+    assert entities[1].acceleration == Vector2(-1, 0)
+
+
+@pytest.mark.parametrize("target_count", [1, 3])
+def test_seek_flee_arrive_targets_mismatch_raises_error(target_count: int) -> None:
+    """Test that fewer or more targets than entities aren't silently accepted."""
+    # arrange
+    entities = [Entity(position=Vector2(x, 0), velocity=Vector2()) for x in (0, 1)]
+    steering = Steering(entities, max_speed=1, max_force=1)
+    targets = [Vector2(5, 5)] * target_count
+    # act, assert
+    with pytest.raises(ValueError, match="Expected 2 targets"):
+        steering.seek(targets)
+    with pytest.raises(ValueError, match="Expected 2 threats"):
+        steering.flee(targets)
+    with pytest.raises(ValueError, match="Expected 2 targets"):
+        steering.arrive(targets, slowing_radius=1)
+    assert steering.force_xs == [0, 0]
+
+
+def test_apply_clamps_to_max_force() -> None:
+    # arrange
+    entity = Entity(position=Vector2(0, 0), velocity=Vector2(0, 0))
+    steering = Steering([entity], max_speed=10, max_force=1)
+    # act
+    steering.seek([Vector2(3, 4)], weight=2)
+    steering.apply()
+    # assert
+    assert entity.acceleration is not None
+    assert entity.acceleration.length() == pytest.approx(1)
+    assert entity.acceleration.normalize() == Vector2(0.6, 0.8)
+
+
+def test_neighbors() -> None:
+    # arrange
+    entities = [
+        Entity(position=Vector2(0, 0), velocity=Vector2()),
+        Entity(position=Vector2(3, 0), velocity=Vector2()),
+        Entity(position=Vector2(10, 0), velocity=Vector2()),
+    ]
+    steering = Steering(entities, max_speed=1, max_force=1)
+    # act
+    neighbors = steering.neighbors(5)
+    # assert
+    assert [sorted(indices) for indices in neighbors] == [[1], [0], []]
+    assert steering.neighbors(5) is neighbors
+
+
+def test_separation_cohesion() -> None:
+    """Test that near neighbors repel, and far neighbors attract."""
+    # arrange
+    entities = [
+        Entity(position=Vector2(0, 0), velocity=Vector2()),
+        Entity(position=Vector2(1, 0), velocity=Vector2()),
+        Entity(position=Vector2(50, 0), velocity=Vector2()),
+    ]
+    near = Steering(entities, max_speed=1, max_force=100)
+    far = Steering(entities, max_speed=1, max_force=100)
+    # act
+    near.separation(5)
+    far.cohesion(100)
+    # assert
+    assert (near.force_xs[0], near.force_xs[1], near.force_xs[2]) == (-1, 1, 0)
+    assert far.force_xs[0] == 1
+    assert far.force_xs[2] == -1
+
+
+def test_alignment() -> None:
+    # arrange
+    entities = [
+        Entity(position=Vector2(0, 0), velocity=Vector2(0, 0)),
+        Entity(position=Vector2(1, 0), velocity=Vector2(0, 3)),
+        Entity(position=Vector2(0, 1), velocity=Vector2(0, 1)),
+    ]
+    steering = Steering(entities, max_speed=2, max_force=100)
+    # act
+    steering.alignment(5)
+    # assert
+    assert (steering.force_xs[0], steering.force_ys[0]) == (0, 2)
+
+
+def test_limit_speed() -> None:
+    # arrange
+    fast = Entity(position=Vector2(), velocity=Vector2(3, 4))
+    slow = Entity(position=Vector2(), velocity=Vector2(0.3, 0.4))
+    # act
+    limit_speed([fast, slow], 1)
+    # assert
+    assert fast.velocity.length() == pytest.approx(1)
+    assert fast.velocity.normalize() == Vector2(0.6, 0.8)
+    assert slow.velocity == Vector2(0.3, 0.4)
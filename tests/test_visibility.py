@@ -0,0 +1,66 @@
+"""Tests for `visibility` module."""
+
+from flatlandian import geometry, visibility
+from flatlandian.int_vector2 import IntVector2
+
+
+def _wall_at_x_2(x: int, _y: int) -> bool:
+    return x == 2
+
+
+def test_has_line_of_sight() -> None:
+    # arrange
+    los = visibility.has_line_of_sight
+    # act
+    # assert
+    assert los(IntVector2(0, 0), IntVector2(1, 5), _wall_at_x_2)
+    assert not los(IntVector2(0, 0), IntVector2(4, 1), _wall_at_x_2)
+
+
+def test_has_line_of_sight_ends_not_checked() -> None:
+    """Test that an opaque cell at either end doesn't block the view."""
+    # arrange
+    los = visibility.has_line_of_sight
+    # act
+    # assert
+    assert los(IntVector2(0, 0), IntVector2(2, 0), _wall_at_x_2)
+    assert los(IntVector2(2, 0), IntVector2(0, 0), _wall_at_x_2)
+
+
+def test_field_of_view_open() -> None:
+    """Test that with nothing opaque, the view is the circle."""
+    # arrange
+    origin = IntVector2(3, -4)
+    # act
+    view = visibility.field_of_view(origin, 6, lambda _x, _y: False)
+    # assert
+    assert set(view) == geometry.cells_in_circle(center=origin, radius=6)
+    assert len(view) == len(geometry.cells_in_circle(center=origin, radius=6))
+
+
+def test_field_of_view_wall() -> None:
+    """Test that an opaque cell is visible, but cells behind it aren't."""
+    # arrange
+    # act
+    view = visibility.field_of_view(IntVector2(0, 0), 5, _wall_at_x_2)
+    # assert
+    assert IntVector2(1, 0) in view
+    assert IntVector2(2, 0) in view
+    assert IntVector2(3, 0) not in view
+    assert IntVector2(-3, 0) in view
+
+
+def test_field_of_view_size() -> None:
+    """Test that cells outside the grid aren't visible."""
+    # arrange
+    # act
+    view = visibility.field_of_view(
+        IntVector2(0, 0), 3, lambda _x, _y: False, size=IntVector2(2, 2)
+    )
+    # assert
+    assert set(view) == {
+        IntVector2(0, 0),
+        IntVector2(0, 1),
+        IntVector2(1, 0),
+        IntVector2(1, 1),
+    }
@@ -1,5 +1,8 @@
 """Tests for `Entity` class."""
 
+import random
+
+import pytest
 from pygame.math import Vector2
 
 from flatlandian.entity import Entity
@@ -114,3 +117,114 @@ def test_position_in_bounds__centered_origin__negative() -> None:
     result = [not w.position_is_in_bounds(p) for p in points]
     # assert
     assert False not in result
+
+
+def test_update__collisions() -> None:
+    """Test that overlapping entities are found and resolved on update."""
+    # arrange
+    w = World(
+        size_from_sequence=(100, 100), detect_collisions=True, resolve_collisions=True
+    )
+    a = Entity(position=Vector2(10, 10), velocity=Vector2(1, 0), radius=1)
+    b = Entity(position=Vector2(12, 10), velocity=Vector2(-1, 0), radius=1)
+    w.add_entity(a)
+    w.add_entity(b)
+    # act
+    w.update(delta_time=0.5)
+    # assert
+    first, second = w.contacts
+    assert len(first) == len(second) == 1
+    assert {w.contact_entities[first[0]], w.contact_entities[second[0]]} == {a, b}
+    assert a.velocity == Vector2(-1, 0)
+    assert b.velocity == Vector2(1, 0)
+
+
+def test_update__contain_entities() -> None:
+    """Test that entities are kept within the world on update."""
+    # arrange
+    w = World(size_from_sequence=(10, 10), contain_entities=True)
+    e = Entity(position=Vector2(5, 1), velocity=Vector2(0, -1), radius=1)
+    w.add_entity(e)
+    # act
+    w.update(delta_time=1)
+    # assert
+    assert e.position == Vector2(5, 1)
+    assert e.velocity == Vector2(0, 1)
+
+
+def test_random_positions() -> None:
+    """Test that positions are in bounds, and reproducible from a seed."""
+    # arrange
+    w = World(size_from_sequence=(4, 2), centered_origin=True)
+    # act
+    positions = w.random_positions(100, rng=random.Random(1))
+    # assert
+    assert len(positions) == 100
+    assert all(w.position_is_in_bounds(p) for p in positions)
+    assert positions == w.random_positions(100, rng=random.Random(1))
+
+
+def test_random_edge_positions() -> None:
+    """Test that positions are on the offset edge, and reproducible from a seed."""
+    # arrange
+    w = World(size_from_sequence=(4, 2), centered_origin=True)
+    # act
+    positions = w.random_edge_positions(100, 1, rng=random.Random(1))
+    # assert
+    assert all(w.position_is_in_bounds(p, offset=1) for p in positions)
+    assert not any(w.position_is_in_bounds(p, offset=0.5) for p in positions)
+    assert positions == w.random_edge_positions(100, 1, rng=random.Random(1))
+
+
+@pytest.mark.parametrize("sharding", ["ROUND_ROBIN", "REGION"])
+def test_update__threads(sharding: str) -> None:
+    """Test that threaded update matches single-threaded update."""
+    # arrange
+    rng = random.Random(1)
+    worlds = [
+        World(size_from_sequence=(100, 100), contain_entities=True),
+        World(
+            size_from_sequence=(100, 100),
+            contain_entities=True,
+            threads=3,
+            sharding=sharding,
+        ),
+    ]
+    for position in worlds[0].random_positions(50, rng=rng):
+        velocity = Vector2(rng.uniform(-50, 50), rng.uniform(-50, 50))
+        for w in worlds:
+            w.add_entity(Entity(position=Vector2(position), velocity=Vector2(velocity)))
+    # act
+    for w in worlds:
+        for _ in range(10):
+            w.update(delta_time=0.1)
+
+        w.close()
+    # assert
+    single, threaded = (
+        sorted((tuple(e.position), tuple(e.velocity)) for e in w.entities)
+        for w in worlds
+    )
+    assert single == threaded
+    assert worlds[1].step_counter == 10
+
+
+def test_shards() -> None:
+    # arrange
+    w = World(size_from_sequence=(100, 100), threads=2, sharding="REGION")
+    entities = [
+        Entity(position=Vector2(x, 50), velocity=Vector2()) for x in (90, 10, 80, 20)
+    ]
+    for e in entities:
+        w.add_entity(e)
+    # act
+    shards = w.shards()
+    # assert
+    assert [[e.position.x for e in shard] for shard in shards] == [[10, 20], [80, 90]]
+
+
+def test_create__invalid_threads_raises_error() -> None:
+    # arrange
+    # act, assert
+    with pytest.raises(ValueError, match="at least 1 thread"):
+        World(size_from_sequence=(1, 1), threads=0)